@@ -1,8 +1,18 @@
+import argparse
+import heapq
+import random
+import time
+import tracemalloc
+from array import array
+
+
 class ListNode:
     """
     Клас для вузла однозв'язного списку.
     """
 
+    __slots__ = ("value", "next")  # Без __dict__ для економії пам'яті
+
     def __init__(self, value=0, next=None):
         self.value = value
         self.next = next
@@ -15,18 +25,77 @@ class LinkedList:
 
     def __init__(self):
         self.head = None
+        self.tail = None  # Останній вузол для додавання за O(1)
+        self.size = 0
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Створює список з елементів ітерованого об'єкта за лінійний час.
+        """
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def __len__(self):
+        """
+        Повертає кількість вузлів у списку за O(1).
+        """
+        return self.size
+
+    def __iter__(self):
+        """
+        Повертає значення вузлів від голови до хвоста.
+        """
+        current = self.head
+        while current:
+            yield current.value
+            current = current.next
 
     def append(self, value):
         """
         Додає новий вузол у кінець списку.
         """
+        node = ListNode(value)
         if not self.head:
-            self.head = ListNode(value)
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.size += 1
+
+    def extend(self, iterable):
+        """
+        Додає всі елементи ітерованого об'єкта в кінець списку.
+        """
+        dummy = ListNode()  # Фіктивний вузол для ланцюжка нових елементів
+        tail = dummy
+        count = 0
+        for value in iterable:
+            tail.next = ListNode(value)
+            tail = tail.next
+            count += 1
+        if not count:
             return
-        current = self.head
-        while current.next:
+        if self.head:
+            self.tail.next = dummy.next
+        else:
+            self.head = dummy.next
+        self.tail = tail
+        self.size += count
+
+    def _relink(self, head):
+        """
+        Встановлює нову голову списку та перераховує хвіст і довжину.
+        """
+        self.head = head
+        self.tail = None
+        self.size = 0
+        current = head
+        while current:
+            self.tail = current
+            self.size += 1
             current = current.next
-        current.next = ListNode(value)
 
     def print_list(self):
         """
@@ -44,6 +113,7 @@ class LinkedList:
         """
         prev = None
         current = self.head
+        self.tail = current  # Колишня голова стає хвостом
         while current:
             next_node = current.next
             current.next = prev
@@ -66,47 +136,450 @@ class LinkedList:
                 l2 = l2.next
             tail = tail.next
         tail.next = l1 if l1 else l2
+        self._relink(dummy.next)
+
+    def merge_k_sorted_lists(self, lists):
+        """
+        Об'єднує k відсортованих однозв'язних списків (задані головними вузлами)
+        в один відсортований список за O(n log k) за допомогою купи.
+        """
+        # Індекс списку в кортежі розв'язує нічиї та зберігає стабільність
+        heap = [(node.value, i, node) for i, node in enumerate(lists) if node]
+        heapq.heapify(heap)
+
+        dummy = ListNode()  # Фіктивний вузол
+        tail = dummy
+        size = 0
+        while heap:
+            _, i, node = heap[0]
+            tail.next = node
+            tail = node
+            size += 1
+            if node.next:
+                heapq.heapreplace(heap, (node.next.value, i, node.next))
+            else:
+                heapq.heappop(heap)
+
         self.head = dummy.next
+        self.tail = tail if size else None
+        self.size = size
 
-    def sort(self):
+    def sort(self, key=None, reverse=False):
         """
-        Сортує однозв'язний список методом злиття (Merge Sort).
+        Сортує однозв'язний список ітеративним висхідним злиттям (Merge Sort).
+
+        Спочатку список розбивається на природні впорядковані серії (спадні серії
+        розвертаються), потім серії попарно зливаються, доки не залишиться одна.
+        Тому вже відсортовані чи майже відсортовані списки обробляються майже
+        за O(n). Сортування стабільне, параметри key та reverse працюють як у sorted().
         """
         if not self.head or not self.head.next:
-            return self.head
-
-        def get_middle(node):
-            slow, fast = node, node.next
-            while fast and fast.next:
-                slow = slow.next
-                fast = fast.next.next
-            return slow
-
-        def merge_sort(node):
-            if not node or not node.next:
-                return node
-            middle = get_middle(node)
-            next_to_middle = middle.next
-            middle.next = None
-            left = merge_sort(node)
-            right = merge_sort(next_to_middle)
-            return merge(left, right)
-
-        def merge(l1, l2):
-            dummy = ListNode()
-            tail = dummy
-            while l1 and l2:
-                if l1.value < l2.value:
-                    tail.next = l1
-                    l1 = l1.next
+            return
+
+        # Вузли у початковому порядку: якщо key чи порівняння згенерує виняток,
+        # за ними список відновлюється без змін
+        nodes = []
+        current = self.head
+        while current:
+            nodes.append(current)
+            current = current.next
+
+        if key is not None:
+            # Ключі обчислюються до будь-яких змін у списку
+            values = [node.value for node in nodes]
+            keys = [key(value) for value in values]
+
+        try:
+            if key is not None:
+                # Ключ обчислюється один раз: тимчасово зберігаємо його у вузлі
+                for node, node_key in zip(nodes, keys):
+                    node.value = node_key
+
+            if reverse:
+                # Як у sorted(): розворот до і після стабільного сортування
+                # зберігає порядок рівних елементів
+                self.reverse()
+
+            # Розбиття на природні серії, які одразу зливаються у стеку (голова, хвіст,
+            # довжина): як у двійковому лічильнику, зливаються серії однакового
+            # порядку довжини, тож ширина злиття подвоюється, а дані, що зливаються,
+            # ще знаходяться в кеші
+            runs = []
+            current = self.head
+            while current:
+                run_head = current
+                run_size = 1
+                if current.next and current.next.value < current.value:
+                    # Строго спадна серія: розвертаємо її на місці
+                    prev = None
+                    while current.next and current.next.value < current.value:
+                        run_size += 1
+                        next_node = current.next
+                        current.next = prev
+                        prev = current
+                        current = next_node
+                    next_node = current.next
+                    current.next = prev
+                    run_head.next = None
+                    runs.append((current, run_head, run_size))
                 else:
-                    tail.next = l2
-                    l2 = l2.next
-                tail = tail.next
-            tail.next = l1 if l1 else l2
-            return dummy.next
+                    while current.next and not current.next.value < current.value:
+                        run_size += 1
+                        current = current.next
+                    next_node = current.next
+                    current.next = None
+                    runs.append((run_head, current, run_size))
+                current = next_node
+
+                while len(runs) > 1 and runs[-2][2] <= 2 * runs[-1][2]:
+                    right = runs.pop()
+                    runs.append(_merge_runs(runs.pop(), right))
+
+            while len(runs) > 1:
+                right = runs.pop()
+                runs.append(_merge_runs(runs.pop(), right))
+
+            self.head, self.tail, _ = runs[0]
+        except BaseException:
+            for node, next_node in zip(nodes, nodes[1:]):
+                node.next = next_node
+            nodes[-1].next = None
+            self.head, self.tail = nodes[0], nodes[-1]
+            raise
+        finally:
+            if key is not None:
+                for node, value in zip(nodes, values):
+                    node.value = value
+
+        if reverse:
+            self.reverse()
+
+
+def _iter_nodes(node):
+    """
+    Повертає значення ланцюжка вузлів, починаючи з заданого.
+    """
+    while node:
+        yield node.value
+        node = node.next
+
+
+def iter_merge_sorted(sources):
+    """
+    Ліниво об'єднує відсортовані джерела, не створюючи результуючого списку.
+
+    Джерелами можуть бути головні вузли, об'єкти LinkedList або будь-які
+    відсортовані ітеровані об'єкти (наприклад, потоки, що читаються з диска).
+    У пам'яті одночасно зберігається лише по одному значенню з кожного джерела.
+    """
+    iterables = [
+        _iter_nodes(source) if isinstance(source, ListNode) else source
+        for source in sources
+    ]
+    return heapq.merge(*iterables)
+
+
+def _merge_runs(left_run, right_run):
+    """
+    Стабільно зливає дві відсортовані серії (голова, хвіст, довжина)
+    та повертає серію-результат.
+    """
+    l1, l1_tail, l1_size = left_run
+    l2, l2_tail, l2_size = right_run
+    size = l1_size + l2_size
+    dummy = ListNode()
+    tail = dummy
+    while l1 and l2:
+        if l2.value < l1.value:
+            tail.next = l2
+            l2 = l2.next
+        else:
+            tail.next = l1
+            l1 = l1.next
+        tail = tail.next
+    if l1:
+        tail.next = l1
+        return dummy.next, l1_tail, size
+    tail.next = l2
+    return dummy.next, l2_tail, size
+
+
+def _top_down_merge_sort(head):
+    """
+    Попередня рекурсивна реалізація сортування злиттям (для порівняння швидкодії).
+    """
+
+    def get_middle(node):
+        slow, fast = node, node.next
+        while fast and fast.next:
+            slow = slow.next
+            fast = fast.next.next
+        return slow
+
+    def merge_sort(node):
+        if not node or not node.next:
+            return node
+        middle = get_middle(node)
+        next_to_middle = middle.next
+        middle.next = None
+        left = merge_sort(node)
+        right = merge_sort(next_to_middle)
+        return merge(left, right)
+
+    def merge(l1, l2):
+        dummy = ListNode()
+        tail = dummy
+        while l1 and l2:
+            if l1.value < l2.value:
+                tail.next = l1
+                l1 = l1.next
+            else:
+                tail.next = l2
+                l2 = l2.next
+            tail = tail.next
+        tail.next = l1 if l1 else l2
+        return dummy.next
+
+    return merge_sort(head)
+
+
+def benchmark_sort(n=1_000_000, seed=0):
+    """
+    Порівнює висхідне сортування LinkedList.sort з попередньою рекурсивною
+    реалізацією на випадкових, відсортованих і майже відсортованих даних.
+    """
+    rng = random.Random(seed)
+    random_values = [rng.random() for _ in range(n)]
+    sorted_values = sorted(random_values)
+    nearly_sorted = sorted_values[:]
+    for _ in range(n // 100):  # 1% випадкових перестановок
+        i, j = rng.randrange(n), rng.randrange(n)
+        nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+
+    print(f"Порівняння сортувань для {n} вузлів:")
+    for name, values in (
+        ("випадкові", random_values),
+        ("відсортовані", sorted_values),
+        ("майже відсортовані", nearly_sorted),
+    ):
+        linked_list = LinkedList.from_iterable(values)
+        start = time.perf_counter()
+        _top_down_merge_sort(linked_list.head)
+        top_down_time = time.perf_counter() - start
+
+        linked_list = LinkedList.from_iterable(values)
+        start = time.perf_counter()
+        linked_list.sort()
+        bottom_up_time = time.perf_counter() - start
+
+        print(
+            f"{name}: рекурсивне {top_down_time:.3f} с, "
+            f"висхідне {bottom_up_time:.3f} с"
+        )
+
+
+NIL = -1  # Індекс, що позначає відсутність наступного вузла
+
+
+class ArrayLinkedList:
+    """
+    Однозв'язний список, що зберігає значення та індекси наступних вузлів
+    у паралельних масивах array замість окремих об'єктів ListNode.
+
+    Звільнені комірки утворюють список вільних місць і використовуються повторно.
+    """
+
+    def __init__(self, typecode="q"):
+        self.values = array(typecode)  # Значення вузлів
+        self.next_indices = array("q")  # Індекс наступного вузла або NIL
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+        self.free = NIL  # Голова списку вільних комірок
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode="q"):
+        """
+        Створює список з елементів ітерованого об'єкта за лінійний час.
+        """
+        linked_list = cls(typecode)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def __len__(self):
+        """
+        Повертає кількість вузлів у списку за O(1).
+        """
+        return self.size
+
+    def __iter__(self):
+        """
+        Повертає значення вузлів від голови до хвоста.
+        """
+        values, next_indices = self.values, self.next_indices
+        current = self.head
+        while current != NIL:
+            yield values[current]
+            current = next_indices[current]
+
+    def _allocate(self, value):
+        """
+        Повертає індекс комірки для нового вузла, за можливості з вільного списку.
+        """
+        if self.free != NIL:
+            index = self.free
+            self.free = self.next_indices[index]
+            self.values[index] = value
+            self.next_indices[index] = NIL
+            return index
+        self.values.append(value)
+        self.next_indices.append(NIL)
+        return len(self.values) - 1
+
+    def append(self, value):
+        """
+        Додає новий вузол у кінець списку.
+        """
+        index = self._allocate(value)
+        if self.head == NIL:
+            self.head = index
+        else:
+            self.next_indices[self.tail] = index
+        self.tail = index
+        self.size += 1
+
+    def extend(self, iterable):
+        """
+        Додає всі елементи ітерованого об'єкта в кінець списку.
+        """
+        for value in iterable:
+            self.append(value)
 
-        self.head = merge_sort(self.head)
+    def remove(self, value):
+        """
+        Видаляє перший вузол із заданим значенням і повертає комірку у вільний список.
+        """
+        values, next_indices = self.values, self.next_indices
+        prev = NIL
+        current = self.head
+        while current != NIL and values[current] != value:
+            prev = current
+            current = next_indices[current]
+        if current == NIL:
+            raise ValueError(f"{value!r} немає у списку")
+
+        if prev == NIL:
+            self.head = next_indices[current]
+        else:
+            next_indices[prev] = next_indices[current]
+        if current == self.tail:
+            self.tail = prev
+
+        next_indices[current] = self.free
+        self.free = current
+        self.size -= 1
+
+    def print_list(self):
+        """
+        Виводить всі елементи списку.
+        """
+        for value in self:
+            print(value, end=" -> ")
+        print("None")
+
+    def reverse(self):
+        """
+        Реверсує список, змінюючи індекси наступних вузлів.
+        """
+        next_indices = self.next_indices
+        prev = NIL
+        current = self.head
+        self.tail = current
+        while current != NIL:
+            next_node = next_indices[current]
+            next_indices[current] = prev
+            prev = current
+            current = next_node
+        self.head = prev
+
+    def sort(self, key=None, reverse=False):
+        """
+        Сортує список. Параметри key та reverse працюють як у sorted().
+
+        Значення сортуються вбудованим sorted і записуються в комірки підряд,
+        тож після сортування список займає суцільний блок без вільних місць.
+        """
+        values = sorted(self, key=key, reverse=reverse)
+        self.values = array(self.values.typecode, values)
+        self.next_indices = array("q", range(1, len(values) + 1))
+        if values:
+            self.next_indices[-1] = NIL
+        self.head = 0 if values else NIL
+        self.tail = len(values) - 1 if values else NIL
+        self.free = NIL
+
+
+def benchmark_representations(n=1_000_000):
+    """
+    Порівнює пам'ять на вузол та швидкість операцій для LinkedList
+    і ArrayLinkedList.
+    """
+    print(f"Порівняння представлень списку для {n} вузлів:")
+    # Перемішані значення, щоб sort вимірював справжнє сортування, а не
+    # швидкий прохід по вже впорядкованих серіях
+    values = list(range(n))
+    random.Random(0).shuffle(values)
+    for cls in (LinkedList, ArrayLinkedList):
+        # Пам'ять вимірюється окремим проходом: tracemalloc сповільнює
+        # кожне виділення і спотворив би час append. Значення створюються
+        # заново, щоб їхня пам'ять теж врахувалася
+        tracemalloc.start()
+        linked_list = cls()
+        for value in range(n):
+            linked_list.append(value)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del linked_list
+
+        start = time.perf_counter()
+        linked_list = cls()
+        for value in values:
+            linked_list.append(value)
+        append_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in linked_list:
+            pass
+        iter_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        linked_list.reverse()
+        reverse_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        linked_list.sort()
+        sort_time = time.perf_counter() - start
+
+        print(
+            f"{cls.__name__}: {memory / n:.1f} байт/вузол, "
+            f"append {n / append_time:,.0f} оп/с, "
+            f"обхід {n / iter_time:,.0f} вузлів/с, "
+            f"reverse {n / reverse_time:,.0f} вузлів/с, "
+            f"sort {sort_time:.3f} с"
+        )
+
+
+def parse_args():
+    """
+    Розбирає аргументи командного рядка.
+    """
+    parser = argparse.ArgumentParser(description="Однозв'язний список.")
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Порівняти представлення списку та швидкість сортування.",
+    )
+    return parser.parse_args()
 
 
 # Приклад використання
@@ -123,3 +596,9 @@ ll.print_list()
 print("Відсортований список:")
 ll.sort()
 ll.print_list()
+
+if __name__ == "__main__":
+    # Бенчмарки тривають довго, тож запускаються лише за прапорцем --benchmark
+    if parse_args().benchmark:
+        benchmark_representations()
+        benchmark_sort()
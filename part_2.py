@@ -1,4 +1,9 @@
-import turtle
+import argparse
+import time
+
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 
 
 def draw_pythagorean_tree(branch_length, level):
@@ -9,6 +14,10 @@ def draw_pythagorean_tree(branch_length, level):
         branch_length (int): Довжина поточної гілки.
         level (int): Поточний рівень рекурсії.
     """
+    # turtle потребує tkinter, тому імпортується лише тут, а не в модулі:
+    # рендеринг у файл працює і без графічного середовища
+    import turtle
+
     if level == 0:
         return
 
@@ -29,11 +38,133 @@ def draw_pythagorean_tree(branch_length, level):
     turtle.backward(branch_length)
 
 
+def pythagorean_tree_segments(
+    branch_length, level, scale=0.7, angle=45, origin=(0, -300)
+):
+    """
+    Ітеративно обчислює відрізки фрактала "дерево Піфагора" рівень за рівнем.
+
+    Усі гілки одного рівня обчислюються разом як масиви NumPy, тому
+    рекурсії та руху черепашки немає.
+
+    Args:
+        branch_length (float): Довжина стовбура.
+        level (int): Кількість рівнів.
+        scale (float): Коефіцієнт зменшення довжини гілки на кожному рівні.
+        angle (float): Кут відхилення гілок у градусах.
+        origin (tuple): Початкова точка стовбура.
+
+    Returns:
+        np.ndarray: Масив розміру (2**level - 1, 2, 2) з початком і кінцем
+            кожного відрізка.
+    """
+    starts = np.array([origin], dtype=float)
+    headings = np.array([90.0])  # Стовбур спрямований угору
+    length = branch_length
+    segments = []
+
+    for _ in range(level):
+        radians = np.radians(headings)
+        ends = starts + length * np.column_stack((np.cos(radians), np.sin(radians)))
+        segments.append(np.stack((starts, ends), axis=1))
+
+        # Кожна гілка дає ліву та праву гілку наступного рівня
+        starts = np.repeat(ends, 2, axis=0)
+        headings = np.column_stack((headings + angle, headings - angle)).ravel()
+        length *= scale
+
+    if not segments:
+        return np.empty((0, 2, 2))
+    return np.concatenate(segments)
+
+
+def render_pythagorean_tree(segments, output=None, figsize=(8, 8)):
+    """
+    Малює відрізки дерева одним LineCollection без відкриття вікна.
+
+    Args:
+        segments (np.ndarray): Відрізки з pythagorean_tree_segments.
+        output (str | None): Файл для збереження (формат за розширенням,
+            наприклад .png або .svg).
+        figsize (tuple): Розмір зображення в дюймах.
+
+    Returns:
+        Figure: Фігура matplotlib з деревом.
+    """
+    figure = Figure(figsize=figsize)
+    ax = figure.subplots()
+    ax.add_collection(LineCollection(segments, colors="black", linewidths=0.5))
+    ax.set_aspect("equal")
+    ax.autoscale_view()
+    ax.set_axis_off()
+    if output is not None:
+        figure.savefig(output)
+    return figure
+
+
+def benchmark_levels(levels=range(5, 21, 5), branch_length=100):
+    """
+    Вимірює час обчислення геометрії та рендерингу для різних рівнів.
+
+    Args:
+        levels (iterable): Рівні для вимірювання.
+        branch_length (float): Довжина стовбура.
+    """
+    print("Час побудови дерева Піфагора за рівнями:")
+    for level in levels:
+        start = time.perf_counter()
+        segments = pythagorean_tree_segments(branch_length, level)
+        geometry_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        render_pythagorean_tree(segments).canvas.draw()
+        render_time = time.perf_counter() - start
+
+        print(
+            f"Рівень {level}: {len(segments)} відрізків, "
+            f"геометрія {geometry_time:.3f} с, рендеринг {render_time:.3f} с"
+        )
+
+
+def parse_args():
+    """
+    Розбирає аргументи командного рядка.
+
+    Returns:
+        argparse.Namespace: Параметри запуску.
+    """
+    parser = argparse.ArgumentParser(description='Фрактал "дерево Піфагора".')
+    parser.add_argument("--level", type=int, default=None, help="Рівень рекурсії.")
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Зберегти зображення у файл (PNG/SVG) без вікна turtle.",
+    )
+    parser.add_argument(
+        "--benchmark", action="store_true", help="Виміряти час за рівнями."
+    )
+    return parser.parse_args()
+
+
 def main():
     """
     Головна функція для ініціалізації та запуску малювання.
     """
-    level = int(input("Введіть рівень рекурсії (рекомендується 5-10): "))
+    args = parse_args()
+
+    if args.benchmark:
+        benchmark_levels()
+        return
+
+    level = args.level
+    if level is None:
+        level = int(input("Введіть рівень рекурсії (рекомендується 5-10): "))
+
+    if args.output is not None:
+        render_pythagorean_tree(pythagorean_tree_segments(100, level), args.output)
+        return
+
+    import turtle
 
     turtle.speed("fastest")
     turtle.left(90)
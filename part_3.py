@@ -1,4 +1,18 @@
+import argparse
+import csv
 import heapq
+import mmap
+import pickle
+import random
+import struct
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from multiprocessing import shared_memory
+
+import numpy as np
 
 
 class Graph:
@@ -6,8 +20,30 @@ class Graph:
     Клас для представлення зваженого графа.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size=16):
         self.nodes = {}
+        # Кеш дерев найкоротших шляхів: {джерело: (відстані, попередники)}
+        self.cache = OrderedDict()
+        self.cache_size = cache_size  # Максимальна кількість джерел у кеші (LRU)
+
+    @classmethod
+    def from_edge_list(cls, path, delimiter=None, node_type=str):
+        """
+        Створює граф із файлу списку ребер CSV/TSV (рядки "вершина1,вершина2,вага").
+
+        Файл читається потоково, рядок за рядком. Вершини додаються в порядку
+        першої появи.
+
+        :param delimiter: Роздільник; за замовчуванням табуляція для .tsv і кома
+            для інших файлів.
+        :param node_type: Функція перетворення міток вершин (наприклад, int).
+        """
+        graph = cls()
+        for node1, node2, weight in _read_edges(path, delimiter, node_type):
+            graph.add_node(node1)
+            graph.add_node(node2)
+            graph.add_edge(node1, node2, weight)
+        return graph
 
     def add_node(self, node):
         """
@@ -15,6 +51,9 @@ class Graph:
         """
         if node not in self.nodes:
             self.nodes[node] = []
+            for distances, predecessors in self.cache.values():
+                distances[node] = float("inf")
+                predecessors[node] = None
 
     def add_edge(self, node1, node2, weight):
         """
@@ -22,11 +61,111 @@ class Graph:
         """
         self.nodes[node1].append((node2, weight))
         self.nodes[node2].append((node1, weight))  # Для неорієнтованого графа
+        self._repair_cache(node1, node2, weight)
 
-    def dijkstra(self, start):
+    def update_edge_weight(self, node1, node2, weight):
+        """
+        Змінює вагу ребра між двома вершинами.
+
+        Зменшення ваги виправляє закешовані відстані поширенням лише від змінного
+        ребра; при збільшенні ваги скидаються тільки ті джерела, у дереві
+        найкоротших шляхів яких це ребро використовується.
+        """
+        old_weight = self._replace_edge(node1, node2, weight)
+        self._replace_edge(node2, node1, weight)
+        if weight < old_weight:
+            self._repair_cache(node1, node2, weight)
+        elif weight > old_weight:
+            self._invalidate_cache(node1, node2)
+
+    def remove_edge(self, node1, node2):
+        """
+        Видаляє ребро між двома вершинами.
+        """
+        self._replace_edge(node1, node2, None)
+        self._replace_edge(node2, node1, None)
+        self._invalidate_cache(node1, node2)
+
+    def _replace_edge(self, node1, node2, weight):
+        """
+        Замінює вагу першого ребра node1 -> node2 (None — видаляє ребро)
+        і повертає попередню вагу.
+        """
+        edges = self.nodes[node1]
+        for i, (neighbor, old_weight) in enumerate(edges):
+            if neighbor == node2:
+                if weight is None:
+                    del edges[i]
+                else:
+                    edges[i] = (node2, weight)
+                return old_weight
+        raise KeyError(f"Ребра {node1!r} - {node2!r} немає в графі")
+
+    def _repair_cache(self, node1, node2, weight):
+        """
+        Оновлює закешовані відстані після появи коротшого ребра node1 - node2.
+        """
+        for distances, predecessors in self.cache.values():
+            priority_queue = []
+            for u, v in ((node1, node2), (node2, node1)):
+                if distances[u] + weight < distances[v]:
+                    distances[v] = distances[u] + weight
+                    predecessors[v] = u
+                    priority_queue.append((distances[v], v))
+            if priority_queue:
+                heapq.heapify(priority_queue)
+                self._relax(priority_queue, distances, predecessors)
+
+    def _invalidate_cache(self, node1, node2):
+        """
+        Скидає закешовані дерева, у яких використовується ребро node1 - node2.
+        """
+        for source in list(self.cache):
+            _, predecessors = self.cache[source]
+            if predecessors[node2] == node1 or predecessors[node1] == node2:
+                del self.cache[source]
+
+    def _relax(self, priority_queue, distances, predecessors):
+        """
+        Основний цикл алгоритму Дейкстри: обробляє вершини з черги, поки вона
+        не спорожніє, оновлюючи відстані та попередників.
+        """
+        while priority_queue:
+            current_distance, current_node = heapq.heappop(priority_queue)
+
+            if current_distance > distances[current_node]:
+                continue
+
+            for neighbor, weight in self.nodes[current_node]:
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    predecessors[neighbor] = current_node
+                    heapq.heappush(priority_queue, (distance, neighbor))
+
+    def shortest_path_tree(self, start):
+        """
+        Алгоритм Дейкстри, що повертає відстані та попередників кожної вершини.
+
+        :return: Кортеж словників (відстані, попередники).
+        """
+        distances = {node: float("inf") for node in self.nodes}
+        predecessors = dict.fromkeys(self.nodes)
+        distances[start] = 0
+        self._relax([(0, start)], distances, predecessors)
+        return distances, predecessors
+
+    def dijkstra(self, start, queue=None):
         """
         Алгоритм Дейкстри для знаходження найкоротших шляхів від стартової вершини.
+
+        :param queue: Черга з пріоритетом: None (heapq з лінивим видаленням),
+            назва з QUEUES ("binary", "dary", "bucket") або готовий об'єкт
+            черги, лічильники якого можна переглянути після виклику.
         """
+        if queue is not None:
+            return self._dijkstra_with_queue(start, queue)
+
         distances = {node: float("inf") for node in self.nodes}
         distances[start] = 0
         priority_queue = [(0, start)]
@@ -45,6 +184,846 @@ class Graph:
 
         return distances
 
+    def _dijkstra_with_queue(self, start, queue):
+        """
+        Алгоритм Дейкстри з підключуваною чергою з пріоритетом.
+        """
+        if isinstance(queue, str):
+            if queue == "bucket":
+                queue = BucketQueue(self.max_weight())
+            else:
+                queue = QUEUES[queue]()
+
+        distances = {node: float("inf") for node in self.nodes}
+        distances[start] = 0
+        queue.push(start, 0)
+
+        while queue:
+            current_distance, current_node = queue.pop()
+
+            for neighbor, weight in self.nodes[current_node]:
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    queue.push(neighbor, distance)
+
+        return distances
+
+    def max_weight(self):
+        """
+        Повертає найбільшу вагу ребра графа (0 для графа без ребер).
+        """
+        return max(
+            (weight for edges in self.nodes.values() for _, weight in edges),
+            default=0,
+        )
+
+    def cached_dijkstra(self, start):
+        """
+        Алгоритм Дейкстри з кешуванням результатів для джерела.
+
+        Кеш підтримується актуальним при зміні графа і зберігає не більше
+        cache_size джерел (найдавніше використані витісняються). Повернутий
+        словник належить кешу, його не слід змінювати.
+        """
+        if start in self.cache:
+            self.cache.move_to_end(start)
+            return self.cache[start][0]
+        # При cache_size=0 дерево одразу витісняється, тож повертаємо його
+        # з локальної змінної, а не з кешу
+        tree = self.shortest_path_tree(start)
+        self.cache[start] = tree
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return tree[0]
+
+    def shortest_path(self, source, target, bidirectional=False):
+        """
+        Знаходить найкоротший шлях між двома вершинами.
+
+        Пошук зупиняється, щойно цільова вершина остаточно оброблена. Якщо
+        bidirectional=True, пошук ведеться одночасно від обох кінців
+        (двонаправлений Дейкстра), що зазвичай обробляє значно менше вершин.
+
+        :return: Кортеж (довжина шляху, список вершин шляху);
+            (inf, []) якщо шляху немає.
+        """
+        if bidirectional:
+            return self._bidirectional_shortest_path(source, target)
+        return self.astar(source, target, _zero_heuristic)
+
+    def astar(self, source, target, heuristic):
+        """
+        Алгоритм A* для пошуку найкоротшого шляху між двома вершинами.
+
+        :param heuristic: Функція heuristic(node, target), що повертає нижню
+            оцінку відстані від node до target (наприклад, евклідову відстань
+            за координатами або LandmarkIndex.heuristic). Оцінка має бути
+            узгодженою, інакше знайдений шлях може бути не найкоротшим.
+        :return: Кортеж (довжина шляху, список вершин шляху);
+            (inf, []) якщо шляху немає.
+        """
+        distances = {source: 0}
+        predecessors = {source: None}
+        visited = set()
+        priority_queue = [(heuristic(source, target), source)]
+
+        while priority_queue:
+            _, current_node = heapq.heappop(priority_queue)
+
+            if current_node in visited:
+                continue
+            current_distance = distances[current_node]
+            if current_node == target:
+                return current_distance, _reconstruct_path(predecessors, target)
+            visited.add(current_node)
+
+            for neighbor, weight in self.nodes[current_node]:
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, float("inf")):
+                    distances[neighbor] = distance
+                    predecessors[neighbor] = current_node
+                    estimate = distance + heuristic(neighbor, target)
+                    heapq.heappush(priority_queue, (estimate, neighbor))
+
+        return float("inf"), []
+
+    def _bidirectional_shortest_path(self, source, target):
+        """
+        Двонаправлений алгоритм Дейкстри для неорієнтованого графа.
+        """
+        if source == target:
+            return 0, [source]
+
+        # Стан прямого (0) та зворотного (1) пошуків
+        distances = ({source: 0}, {target: 0})
+        predecessors = ({source: None}, {target: None})
+        visited = (set(), set())
+        queues = ([(0, source)], [(0, target)])
+
+        best = float("inf")
+        meeting_node = None
+
+        while queues[0] and queues[1]:
+            # Зупинка: жоден шлях через необроблені вершини не буде коротшим
+            if queues[0][0][0] + queues[1][0][0] >= best:
+                break
+
+            # Розширюємо пошук із меншою чергою
+            side = 0 if len(queues[0]) <= len(queues[1]) else 1
+            current_distance, current_node = heapq.heappop(queues[side])
+            if current_node in visited[side]:
+                continue
+            visited[side].add(current_node)
+
+            for neighbor, weight in self.nodes[current_node]:
+                distance = current_distance + weight
+                if distance < distances[side].get(neighbor, float("inf")):
+                    distances[side][neighbor] = distance
+                    predecessors[side][neighbor] = current_node
+                    heapq.heappush(queues[side], (distance, neighbor))
+                # Перевіряємо, чи сусіда вже досягнув пошук з іншого боку
+                if neighbor in distances[1 - side]:
+                    total = distances[side][neighbor] + distances[1 - side][neighbor]
+                    if total < best:
+                        best = total
+                        meeting_node = neighbor
+
+        if meeting_node is None:
+            return float("inf"), []
+
+        forward = _reconstruct_path(predecessors[0], meeting_node)
+        backward = _reconstruct_path(predecessors[1], meeting_node)
+        return best, forward + backward[-2::-1]
+
+    def freeze(self):
+        """
+        Будує компактне незмінне представлення графа у форматі CSR.
+        """
+        return CSRGraph.from_adjacency(self.nodes)
+
+
+class BinaryHeapQueue:
+    """
+    Черга на основі heapq з лінивим видаленням: при зменшенні пріоритету
+    додається новий запис, а застарілі записи пропускаються при вилученні.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.priorities = {}  # Актуальні пріоритети вершин, що ще в черзі
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+
+    def __len__(self):
+        return len(self.priorities)
+
+    def push(self, node, priority):
+        """
+        Додає вершину або зменшує її пріоритет.
+        """
+        self.priorities[node] = priority
+        heapq.heappush(self.heap, (priority, node))
+        self.pushes += 1
+
+    def pop(self):
+        """
+        Вилучає вершину з найменшим пріоритетом і повертає (пріоритет, вершина).
+        """
+        while True:
+            priority, node = heapq.heappop(self.heap)
+            self.pops += 1
+            if self.priorities.get(node) == priority:
+                del self.priorities[node]
+                return priority, node
+            self.stale_pops += 1
+
+
+class DaryHeapQueue:
+    """
+    Індексована d-арна купа зі справжньою операцією зменшення ключа:
+    кожна вершина зберігається в купі не більше одного разу.
+    """
+
+    def __init__(self, d=4):
+        self.d = d
+        self.nodes = []  # Вершини в порядку купи
+        self.priorities = []  # Пріоритети, паралельні до nodes
+        self.positions = {}  # Позиція вершини в купі
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0  # Завжди 0: застарілих записів немає
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def push(self, node, priority):
+        """
+        Додає вершину або зменшує її пріоритет.
+        """
+        self.pushes += 1
+        position = self.positions.get(node)
+        if position is None:
+            position = len(self.nodes)
+            self.nodes.append(node)
+            self.priorities.append(priority)
+        else:
+            self.priorities[position] = priority
+        self._sift_up(position, node, priority)
+
+    def pop(self):
+        """
+        Вилучає вершину з найменшим пріоритетом і повертає (пріоритет, вершина).
+        """
+        self.pops += 1
+        top_node, top_priority = self.nodes[0], self.priorities[0]
+        del self.positions[top_node]
+        last_node, last_priority = self.nodes.pop(), self.priorities.pop()
+        if self.nodes:
+            self._sift_down(0, last_node, last_priority)
+        return top_priority, top_node
+
+    def _sift_up(self, position, node, priority):
+        nodes, priorities, positions = self.nodes, self.priorities, self.positions
+        while position > 0:
+            parent = (position - 1) // self.d
+            if priorities[parent] <= priority:
+                break
+            nodes[position] = nodes[parent]
+            priorities[position] = priorities[parent]
+            positions[nodes[position]] = position
+            position = parent
+        nodes[position] = node
+        priorities[position] = priority
+        positions[node] = position
+
+    def _sift_down(self, position, node, priority):
+        nodes, priorities, positions = self.nodes, self.priorities, self.positions
+        size = len(nodes)
+        while True:
+            first_child = self.d * position + 1
+            if first_child >= size:
+                break
+            last_child = min(first_child + self.d, size)
+            child = min(range(first_child, last_child), key=priorities.__getitem__)
+            if priorities[child] >= priority:
+                break
+            nodes[position] = nodes[child]
+            priorities[position] = priorities[child]
+            positions[nodes[position]] = position
+            position = child
+        nodes[position] = node
+        priorities[position] = priority
+        positions[node] = position
+
+
+class BucketQueue:
+    """
+    Черга з кошиками (алгоритм Діала) для невід'ємних цілих ваг не більших
+    за max_weight: використовує max_weight + 1 циклічних кошиків, тож додавання
+    і вилучення виконуються за O(1) у середньому.
+    """
+
+    def __init__(self, max_weight):
+        self.buckets = [[] for _ in range(max_weight + 1)]
+        self.priorities = {}  # Актуальні пріоритети вершин, що ще в черзі
+        self.current = 0  # Пріоритет, з якого починається пошук кошика
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+
+    def __len__(self):
+        return len(self.priorities)
+
+    def push(self, node, priority):
+        """
+        Додає вершину або зменшує її пріоритет.
+        """
+        self.priorities[node] = priority
+        self.buckets[priority % len(self.buckets)].append(node)
+        self.pushes += 1
+
+    def pop(self):
+        """
+        Вилучає вершину з найменшим пріоритетом і повертає (пріоритет, вершина).
+        """
+        buckets, priorities = self.buckets, self.priorities
+        while True:
+            bucket = buckets[self.current % len(buckets)]
+            while bucket:
+                node = bucket.pop()
+                self.pops += 1
+                if priorities.get(node) == self.current:
+                    del priorities[node]
+                    return self.current, node
+                self.stale_pops += 1
+            self.current += 1
+
+
+QUEUES = {
+    "binary": BinaryHeapQueue,
+    "dary": DaryHeapQueue,
+    "bucket": BucketQueue,
+}
+
+
+def _random_graph(num_nodes, num_edges, max_weight, rng):
+    graph = Graph()
+    for node in range(num_nodes):
+        graph.add_node(node)
+    for _ in range(num_edges):
+        graph.add_edge(
+            rng.randrange(num_nodes),
+            rng.randrange(num_nodes),
+            rng.randint(1, max_weight),
+        )
+    return graph
+
+
+def _grid_graph(side, max_weight, rng):
+    graph = Graph()
+    for node in range(side * side):
+        graph.add_node(node)
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            if col + 1 < side:
+                graph.add_edge(node, node + 1, rng.randint(1, max_weight))
+            if row + 1 < side:
+                graph.add_edge(node, node + side, rng.randint(1, max_weight))
+    return graph
+
+
+def benchmark_queues(num_nodes=100_000, max_weight=100, seed=0):
+    """
+    Порівнює черги з пріоритетом для алгоритму Дейкстри на випадковому
+    та решітчастому графах: кількість додавань, застарілих вилучень і час.
+    """
+    rng = random.Random(seed)
+    graphs = {
+        "випадковий": _random_graph(num_nodes, num_nodes * 8, max_weight, rng),
+        "решітка": _grid_graph(int(num_nodes**0.5), max_weight, rng),
+    }
+    print(f"Порівняння черг для алгоритму Дейкстри ({num_nodes} вершин):")
+    for graph_name, graph in graphs.items():
+        expected = graph.dijkstra(0)
+        for queue_name in QUEUES:
+            if queue_name == "bucket":
+                queue = BucketQueue(graph.max_weight())
+            else:
+                queue = QUEUES[queue_name]()
+            start = time.perf_counter()
+            distances = graph.dijkstra(0, queue=queue)
+            elapsed = time.perf_counter() - start
+            assert distances == expected
+            print(
+                f"{graph_name}, {queue_name}: додавань {queue.pushes}, "
+                f"застарілих вилучень {queue.stale_pops}, час {elapsed:.3f} с"
+            )
+
+
+def _zero_heuristic(node, target):
+    return 0
+
+
+class LandmarkIndex:
+    """
+    Індекс орієнтирів (landmarks) для алгоритму A* з нерівністю трикутника (ALT).
+
+    Для кожного орієнтира L заздалегідь обчислюються відстані до всіх вершин,
+    і тоді |d(L, target) - d(L, node)| є нижньою оцінкою відстані від node
+    до target. Індекс будується один раз і може зберігатися на диск.
+    """
+
+    def __init__(self, landmarks, distances):
+        self.landmarks = landmarks  # Список вершин-орієнтирів
+        self.distances = distances  # {вершина: (відстань до кожного орієнтира)}
+
+    @classmethod
+    def build(cls, graph, num_landmarks=8):
+        """
+        Обирає орієнтири методом найвіддаленішої точки та обчислює відстані
+        до них наявним алгоритмом Дейкстри.
+        """
+        inf = float("inf")
+        landmarks = []
+        columns = []
+        # Мінімальна відстань кожної вершини до вже обраних орієнтирів
+        nearest = dict.fromkeys(graph.nodes, inf)
+        candidate = next(iter(graph.nodes), None)
+
+        while candidate is not None and len(landmarks) < num_landmarks:
+            landmarks.append(candidate)
+            distances = graph.dijkstra(candidate)
+            columns.append(distances)
+            for node, distance in distances.items():
+                nearest[node] = min(nearest[node], distance)
+
+            # Наступний орієнтир — найвіддаленіша вершина; недосяжні вершини
+            # (інша компонента зв'язності) мають пріоритет
+            candidate = max(
+                (node for node in graph.nodes if nearest[node] > 0),
+                key=nearest.__getitem__,
+                default=None,
+            )
+
+        table = {
+            node: tuple(column[node] for column in columns) for node in graph.nodes
+        }
+        return cls(landmarks, table)
+
+    def heuristic(self, node, target):
+        """
+        Нижня оцінка відстані між вершинами за нерівністю трикутника.
+        """
+        bound = 0
+        for from_node, from_target in zip(self.distances[node], self.distances[target]):
+            # Орієнтир з іншої компоненти зв'язності нічого не дає
+            if from_node != float("inf") and from_target != float("inf"):
+                bound = max(bound, abs(from_target - from_node))
+        return bound
+
+    def save(self, path):
+        """
+        Зберігає індекс у файл.
+        """
+        with open(path, "wb") as f:
+            pickle.dump((self.landmarks, self.distances), f)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Завантажує індекс, збережений методом save.
+        """
+        with open(path, "rb") as f:
+            landmarks, distances = pickle.load(f)
+        return cls(landmarks, distances)
+
+
+def _reconstruct_path(predecessors, target):
+    """
+    Відновлює шлях до цільової вершини за словником попередників.
+    """
+    path = []
+    node = target
+    while node is not None:
+        path.append(node)
+        node = predecessors[node]
+    return path[::-1]
+
+
+class CSRGraph:
+    """
+    Незмінний граф у форматі CSR (Compressed Sparse Row).
+
+    Вершини пронумеровані цілими числами 0..n-1. Сусіди вершини u зберігаються
+    в targets[offsets[u]:offsets[u + 1]], а ваги відповідних ребер — у weights.
+    Масиви типізовані (array), тому займають 8 байт на елемент.
+    """
+
+    def __init__(self, labels, offsets, targets, weights, path=None):
+        self.labels = labels  # Мітка вершини за її номером
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.path = path  # Файл, з якого граф відображено в пам'ять (load)
+
+    @cached_property
+    def index(self):
+        """
+        Номер вершини за міткою (будується при першому зверненні).
+        """
+        return {label: i for i, label in enumerate(self.labels)}
+
+    def __reduce__(self):
+        # Відображений у пам'ять граф передається іншим процесам як шлях до файлу
+        if self.path is not None:
+            return CSRGraph.load, (self.path,)
+        return CSRGraph, (self.labels, self.offsets, self.targets, self.weights)
+
+    @classmethod
+    def from_edge_list(cls, path, delimiter=None, node_type=str):
+        """
+        Створює CSR-граф безпосередньо з файлу списку ребер CSV/TSV.
+
+        Файл читається потоково двічі: спочатку рахуються степені вершин,
+        потім заповнюються масиви, тож у пам'яті зберігаються лише вони.
+        Порядок вершин і сусідів такий самий, як у Graph.from_edge_list(...).freeze().
+        """
+        index = {}
+        degrees = array("q")
+        for node1, node2, _ in _read_edges(path, delimiter, node_type):
+            for node in (node1, node2):
+                if node not in index:
+                    index[node] = len(index)
+                    degrees.append(0)
+                degrees[index[node]] += 1
+
+        offsets = array("q", [0]) * (len(degrees) + 1)
+        for i, degree in enumerate(degrees):
+            offsets[i + 1] = offsets[i] + degree
+        targets = array("q", [0]) * offsets[-1]
+        weights = array("d", [0.0]) * offsets[-1]
+        positions = offsets[:-1]  # Наступна вільна позиція для кожної вершини
+
+        for node1, node2, weight in _read_edges(path, delimiter, node_type):
+            id1, id2 = index[node1], index[node2]
+            for source, target in ((id1, id2), (id2, id1)):
+                targets[positions[source]] = target
+                weights[positions[source]] = weight
+                positions[source] += 1
+
+        return cls(list(index), offsets, targets, weights)
+
+    def save(self, path):
+        """
+        Зберігає граф у компактному двійковому форматі: заголовок, масиви CSR
+        та таблиця міток (масив int64 для цілих міток або рядки UTF-8).
+
+        Мітки мають бути унікальними і всі цілими числами або всі рядками,
+        інакше вони не відновляться без змін під час load.
+        """
+        if len(set(self.labels)) != len(self.labels):
+            raise ValueError("Мітки вершин мають бути унікальними")
+        if all(type(label) is int for label in self.labels):
+            label_kind = _INT_LABELS
+            label_data = array("q", self.labels).tobytes()
+        elif all(type(label) is str for label in self.labels):
+            if any("\n" in label for label in self.labels):
+                raise ValueError("Мітки вершин не можуть містити символ нового рядка")
+            label_kind = _STR_LABELS
+            label_data = "\n".join(self.labels).encode("utf-8")
+        else:
+            raise ValueError("Мітки вершин мають бути або всі int, або всі str")
+
+        with open(path, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    len(self.labels),
+                    len(self.targets),
+                    label_kind,
+                    len(label_data),
+                )
+            )
+            for values in (self.offsets, self.targets, self.weights):
+                f.write(memoryview(values).cast("B"))
+            f.write(label_data)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Відкриває граф, збережений методом save, відображаючи файл у пам'ять.
+
+        Масиви CSR не копіюються і не розбираються, тож граф готовий до запитів
+        одразу після відкриття; сторінки файлу підвантажуються за потреби.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, n, m, label_kind, label_size = _HEADER.unpack_from(mapped)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} не є файлом CSR-графа")
+
+        view = memoryview(mapped)
+        start = _HEADER.size
+        sections = []
+        for length, typecode in ((n + 1, "q"), (m, "q"), (m, "d")):
+            sections.append(view[start : start + length * 8].cast(typecode))
+            start += length * 8
+
+        label_view = view[start : start + label_size]
+        if label_kind == _INT_LABELS:
+            labels = label_view.cast("q")
+        else:
+            labels = str(label_view, "utf-8").split("\n") if n else []
+
+        return cls(labels, *sections, path=path)
+
+    @classmethod
+    def from_adjacency(cls, adjacency):
+        """
+        Створює CSR-граф зі словника суміжності {вершина: [(сусід, вага), ...]}.
+        """
+        labels = list(adjacency)
+        index = {label: i for i, label in enumerate(labels)}
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+        for label in labels:
+            for neighbor, weight in adjacency[label]:
+                targets.append(index[neighbor])
+                weights.append(weight)
+            offsets.append(len(targets))
+        return cls(labels, offsets, targets, weights)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def dijkstra_arrays(self, source, distances=None, predecessors=None):
+        """
+        Алгоритм Дейкстри над номерами вершин.
+
+        Відстані та попередники записуються в наперед виділені буфери
+        (будь-які змінювані послідовності довжини n); якщо їх не передано,
+        створюються нові масиви. Відсутній попередник позначається -1.
+
+        :return: Кортеж (distances, predecessors).
+        """
+        n = len(self.labels)
+        if distances is None:
+            distances = array("d", [float("inf")]) * n
+        else:
+            _fill(distances, float("inf"))
+        if predecessors is None:
+            predecessors = array("q", [-1]) * n
+        else:
+            _fill(predecessors, -1)
+
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        distances[source] = 0
+        priority_queue = [(0.0, source)]
+
+        while priority_queue:
+            current_distance, current_node = heapq.heappop(priority_queue)
+
+            if current_distance > distances[current_node]:
+                continue
+
+            for edge in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[edge]
+                distance = current_distance + weights[edge]
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    predecessors[neighbor] = current_node
+                    heapq.heappush(priority_queue, (distance, neighbor))
+
+        return distances, predecessors
+
+    def dijkstra(self, start):
+        """
+        Алгоритм Дейкстри з тим самим інтерфейсом, що й Graph.dijkstra.
+        """
+        distances, _ = self.dijkstra_arrays(self.index[start])
+        return dict(zip(self.labels, distances))
+
+    def dijkstra_many(self, sources, workers=1, out=None):
+        """
+        Обчислює відстані від кожної з вершин sources до всіх вершин графа.
+
+        Якщо workers > 1, джерела розподіляються між процесами. Граф передається
+        процесам один раз під час їх запуску (при fork — без копіювання), а
+        рядки результату записуються у спільну пам'ять.
+
+        :param sources: Мітки вершин-джерел.
+        :param workers: Кількість процесів.
+        :param out: Наперед виділена матриця NumPy розміру (len(sources), n).
+        :return: Матриця відстаней, де рядок відповідає джерелу, а стовпець —
+            вершині у порядку self.labels.
+        """
+        source_ids = [self.index[source] for source in sources]
+        shape = (len(source_ids), len(self.labels))
+        if out is None:
+            out = np.empty(shape, dtype=np.float64)
+
+        if workers <= 1:
+            # Буфери array повторно використовуються для всіх джерел: індексація
+            # array у циклі Дейкстри швидша за скаляри NumPy, тож рядок
+            # копіюється в out один раз на джерело
+            distances = array("d", [0.0]) * shape[1]
+            predecessors = array("q", [-1]) * shape[1]
+            for row, source in enumerate(source_ids):
+                self.dijkstra_arrays(source, distances, predecessors)
+                out[row] = np.frombuffer(distances, dtype=np.float64)
+            return out
+
+        shared = shared_memory.SharedMemory(
+            create=True, size=max(1, shape[0] * shape[1] * 8)
+        )
+        try:
+            # Рівномірно ділимо джерела на пакети (номер рядка, номер вершини)
+            tasks = list(enumerate(source_ids))
+            batch_size = -(-len(tasks) // (workers * 4)) or 1
+            batches = [
+                tasks[i : i + batch_size] for i in range(0, len(tasks), batch_size)
+            ]
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self, shared.name, shape),
+            ) as executor:
+                list(executor.map(_dijkstra_batch, batches))
+
+            out[...] = np.ndarray(shape, dtype=np.float64, buffer=shared.buf)
+        finally:
+            shared.close()
+            shared.unlink()
+        return out
+
+    def multi_source_dijkstra(self, sources):
+        """
+        Алгоритм Дейкстри, запущений одночасно з кількох джерел на відстані 0.
+
+        :return: Кортеж словників ({вершина: відстань до найближчого джерела},
+            {вершина: найближче джерело або None, якщо жодне не досяжне}).
+        """
+        n = len(self.labels)
+        distances = array("d", [float("inf")]) * n
+        nearest = array("q", [-1]) * n
+        priority_queue = []
+        for source in sources:
+            source_id = self.index[source]
+            distances[source_id] = 0
+            nearest[source_id] = source_id
+            priority_queue.append((0.0, source_id))
+        heapq.heapify(priority_queue)
+
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        while priority_queue:
+            current_distance, current_node = heapq.heappop(priority_queue)
+
+            if current_distance > distances[current_node]:
+                continue
+
+            for edge in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[edge]
+                distance = current_distance + weights[edge]
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    nearest[neighbor] = nearest[current_node]
+                    heapq.heappush(priority_queue, (distance, neighbor))
+
+        labels = self.labels
+        return dict(zip(labels, distances)), {
+            label: labels[source] if source >= 0 else None
+            for label, source in zip(labels, nearest)
+        }
+
+
+# Двійковий формат CSR-графа: сигнатура, кількість вершин, кількість записів
+# суміжності, тип міток і розмір таблиці міток у байтах
+_MAGIC = b"CSRGRAPH"
+_HEADER = struct.Struct("<8sqqqq")
+_INT_LABELS = 0
+_STR_LABELS = 1
+
+
+def _fill(buffer, value):
+    """
+    Заповнює буфер значенням на місці, без виділення тимчасового масиву.
+    """
+    if hasattr(buffer, "fill"):
+        buffer.fill(value)  # Масиви NumPy
+    else:
+        for i in range(len(buffer)):
+            buffer[i] = value
+
+
+def _parse_weight(value):
+    """
+    Перетворює вагу ребра на int, якщо вона ціла, інакше на float.
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _read_edges(path, delimiter=None, node_type=str):
+    """
+    Потоково читає файл списку ребер і повертає кортежі (вершина1, вершина2, вага).
+    Порожні рядки та рядки, що починаються з "#", пропускаються.
+    """
+    if delimiter is None:
+        delimiter = "\t" if str(path).endswith(".tsv") else ","
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f, delimiter=delimiter):
+            if not row or row[0].startswith("#"):
+                continue
+            node1, node2, weight = row
+            yield node_type(node1), node_type(node2), _parse_weight(weight)
+
+
+# Граф і спільна матриця результатів у процесі-виконавці dijkstra_many
+_worker_graph = None
+_worker_shared = None
+_worker_matrix = None
+
+
+def _init_worker(graph, shared_name, shape):
+    """
+    Зберігає граф і підключає спільну матрицю результатів у процесі-виконавці.
+    """
+    global _worker_graph, _worker_shared, _worker_matrix
+    _worker_graph = graph
+    _worker_shared = shared_memory.SharedMemory(name=shared_name)
+    _worker_matrix = np.ndarray(shape, dtype=np.float64, buffer=_worker_shared.buf)
+
+
+def _dijkstra_batch(batch):
+    """
+    Обчислює рядки матриці відстаней для пакета (номер рядка, номер джерела).
+    """
+    distances = array("d", [0.0]) * _worker_matrix.shape[1]
+    predecessors = array("q", [-1]) * _worker_matrix.shape[1]
+    for row, source in batch:
+        _worker_graph.dijkstra_arrays(source, distances, predecessors)
+        _worker_matrix[row] = np.frombuffer(distances, dtype=np.float64)
+
+
+def parse_args():
+    """
+    Розбирає аргументи командного рядка.
+    """
+    parser = argparse.ArgumentParser(description="Алгоритм Дейкстри.")
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Порівняти черги з пріоритетом для алгоритму Дейкстри.",
+    )
+    return parser.parse_args()
+
 
 # Приклад використання
 graph = Graph()
@@ -60,3 +1039,9 @@ graph.add_edge("D", "E", 1)
 
 distances = graph.dijkstra("A")
 print("Найкоротші шляхи від вершини A:", distances)
+
+
+if __name__ == "__main__":
+    # Бенчмарки тривають довго, тож запускаються лише за прапорцем --benchmark
+    if parse_args().benchmark:
+        benchmark_queues()
@@ -1,7 +1,8 @@
-import uuid
 import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
 import heapq
+import random
 
 
 class Node:
@@ -9,22 +10,21 @@ class Node:
     Клас для вузла бінарної купи.
     """
 
-    def __init__(self, key, color="skyblue"):
+    def __init__(self, key, color="skyblue", node_id=0):
         self.left = None
         self.right = None
         self.val = key
         self.color = color
-        self.id = str(uuid.uuid4())
+        self.id = node_id  # Індекс вузла в масиві купи
 
 
-def build_heap_tree(heap):
-    """
-    Побудова бінарного дерева на основі купи.
+def build_heap_nodes(heap):
     """
-    if not heap:
-        return None
+    Створює вузли для всіх елементів купи та з'єднує їх у дерево.
 
-    nodes = [Node(key) for key in heap]
+    :return: Список вузлів, де вузол з індексом i відповідає heap[i].
+    """
+    nodes = [Node(key, node_id=i) for i, key in enumerate(heap)]
     for i, node in enumerate(nodes):
         left_index = 2 * i + 1
         right_index = 2 * i + 2
@@ -32,47 +32,304 @@ def build_heap_tree(heap):
             node.left = nodes[left_index]
         if right_index < len(nodes):
             node.right = nodes[right_index]
-    return nodes[0]
+    return nodes
 
 
-def add_edges(graph, node, pos, x=0, y=0, layer=1):
+def build_heap_tree(heap):
     """
-    Рекурсивно додає вузли та ребра до графа для візуалізації.
+    Побудова бінарного дерева на основі купи.
+    """
+    if not heap:
+        return None
+    return build_heap_nodes(heap)[0]
+
+
+class InstrumentedHeap:
+    """
+    Мін-купа з операціями push/pop/replace/heapify, що рахує порівняння
+    та переміщення елементів для кожної операції.
+
+    Якщо trace=True, кожна операція записується в self.trace разом зі станом
+    купи та індексами переміщених вузлів. Індекси відновлюються після операції
+    за початковою та кінцевою позиціями елемента, тому цикли просіювання
+    не містять жодних перевірок трасування.
     """
-    if node is not None:
-        graph.add_node(node.id, color=node.color, label=node.val)
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            l = x - 1 / 2**layer
-            pos[node.left.id] = (l, y - 1)
-            add_edges(graph, node.left, pos, x=l, y=y - 1, layer=layer + 1)
-        if node.right:
-            graph.add_edge(node.id, node.right.id)
-            r = x + 1 / 2**layer
-            pos[node.right.id] = (r, y - 1)
-            add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
-    return graph
 
+    def __init__(self, items=(), trace=False):
+        self.data = list(items)
+        self.trace = [] if trace else None
+        # Підсумки за типами операцій: {операція: [викликів, порівнянь, переміщень]}
+        self.counters = {}
+        self.last_comparisons = 0
+        self.last_swaps = 0
+        if self.data:
+            self.heapify()
 
-def draw_heap(heap):
+    def __len__(self):
+        return len(self.data)
+
+    def push(self, item):
+        """
+        Додає елемент у купу.
+        """
+        self.data.append(item)
+        start = len(self.data) - 1
+        end, comparisons, swaps = self._sift_up(start)
+        moved = _sift_path(end, start) if self.trace is not None else None
+        self._record("push", comparisons, swaps, moved)
+
+    def pop(self):
+        """
+        Вилучає та повертає найменший елемент купи.
+        """
+        last = self.data.pop()
+        if not self.data:
+            self._record("pop", 0, 0, [])
+            return last
+        top = self.data[0]
+        self.data[0] = last
+        end, comparisons, swaps = self._sift_down(0)
+        moved = _sift_path(0, end) if self.trace is not None else None
+        self._record("pop", comparisons, swaps, moved)
+        return top
+
+    def replace(self, item):
+        """
+        Вилучає найменший елемент і додає новий (як heapq.heapreplace).
+        """
+        top = self.data[0]
+        self.data[0] = item
+        end, comparisons, swaps = self._sift_down(0)
+        moved = _sift_path(0, end) if self.trace is not None else None
+        self._record("replace", comparisons, swaps, moved)
+        return top
+
+    def heapify(self):
+        """
+        Перетворює вміст на купу за лінійний час.
+        """
+        total_comparisons = total_swaps = 0
+        # Шляхи переміщень потрібні лише для кадрів трасування
+        moved = [] if self.trace is not None else None
+        for start in reversed(range(len(self.data) // 2)):
+            end, comparisons, swaps = self._sift_down(start)
+            total_comparisons += comparisons
+            total_swaps += swaps
+            # Елементи, що залишилися на місці, не виділяються
+            if moved is not None and end != start:
+                moved.extend(_sift_path(start, end))
+        if moved is not None:
+            moved = sorted(set(moved))
+        self._record("heapify", total_comparisons, total_swaps, moved)
+
+    def _record(self, operation, comparisons, swaps, moved):
+        """
+        Оновлює лічильники та, якщо трасування увімкнене, записує кадр.
+        Без трасування moved дорівнює None і не обчислюється.
+        """
+        self.last_comparisons = comparisons
+        self.last_swaps = swaps
+        counter = self.counters.setdefault(operation, [0, 0, 0])
+        counter[0] += 1
+        counter[1] += comparisons
+        counter[2] += swaps
+        if self.trace is not None:
+            self.trace.append(
+                {
+                    "operation": operation,
+                    "heap": list(self.data),
+                    "moved": moved,
+                    "comparisons": comparisons,
+                    "swaps": swaps,
+                }
+            )
+
+    def _sift_up(self, pos):
+        """
+        Піднімає елемент з позиції pos; повертає (кінцева позиція, порівняння,
+        переміщення).
+        """
+        data = self.data
+        item = data[pos]
+        comparisons = swaps = 0
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            comparisons += 1
+            if item < data[parent]:
+                data[pos] = data[parent]
+                pos = parent
+                swaps += 1
+            else:
+                break
+        data[pos] = item
+        return pos, comparisons, swaps
+
+    def _sift_down(self, pos):
+        """
+        Опускає елемент з позиції pos; повертає (кінцева позиція, порівняння,
+        переміщення).
+        """
+        data = self.data
+        size = len(data)
+        item = data[pos]
+        comparisons = swaps = 0
+        while True:
+            child = 2 * pos + 1
+            if child >= size:
+                break
+            if child + 1 < size:
+                comparisons += 1
+                if data[child + 1] < data[child]:
+                    child += 1
+            comparisons += 1
+            if data[child] < item:
+                data[pos] = data[child]
+                pos = child
+                swaps += 1
+            else:
+                break
+        data[pos] = item
+        return pos, comparisons, swaps
+
+
+def _sift_path(top, bottom):
+    """
+    Повертає індекси вузлів на шляху від top до його нащадка bottom
+    включно. Якщо елемент не переміщувався, шлях складається з однієї
+    комірки, в яку він був записаний.
+    """
+    path = [bottom]
+    while bottom != top:
+        bottom = (bottom - 1) >> 1
+        path.append(bottom)
+    return path[::-1]
+
+
+def _check_trace(trace):
+    """
+    Перевіряє, що кожна комірка, змінена відносно попереднього кадру
+    траси, є серед виділених у moved.
+    """
+    for previous, frame in zip(trace, trace[1:]):
+        before, after = previous["heap"], frame["heap"]
+        changed = {
+            i for i in range(len(after)) if i >= len(before) or before[i] != after[i]
+        }
+        assert changed <= set(frame["moved"]), (frame["operation"], changed)
+
+
+def heap_layout(size):
+    """
+    Обчислює позиції вузлів купи розміру size без побудови дерева.
+
+    Вузол з індексом i знаходиться на рівні floor(log2(i + 1)); на кожному рівні
+    вузли рівномірно розподілені на відрізку [-1, 1], що збігається з розташуванням,
+    де нащадки зсунуті від батька на 1 / 2**рівень.
+
+    :return: Масив NumPy розміру (size, 2) з координатами (x, y).
+    """
+    indices = np.arange(size)
+    levels = np.floor(np.log2(indices + 1)).astype(np.int64)
+    level_starts = (1 << levels) - 1  # Індекс першого вузла на рівні
+    offsets = indices - level_starts
+    x = (2 * offsets + 1) / (1 << levels) - 1
+    return np.column_stack((x, -levels))
+
+
+def heap_edges(size):
+    """
+    Повертає ребра (батько, нащадок) купи розміру size у вигляді масиву NumPy.
+    """
+    children = np.arange(1, size)
+    return np.column_stack(((children - 1) // 2, children))
+
+
+def draw_heap(
+    heap, max_levels=None, colors=None, trace=None, pause=1.0, highlight="orange"
+):
     """
     Візуалізація бінарної купи у вигляді дерева.
+
+    Ідентифікатором вузла є його індекс у масиві купи, позиції обчислюються
+    векторно, а ребра додаються до графа одним викликом.
+
+    :param max_levels: Якщо задано, малюються лише перші max_levels рівнів.
+    :param colors: Кольори вузлів за індексами (за замовчуванням "skyblue").
+    :param trace: Траса операцій InstrumentedHeap; якщо задана, операції
+        відтворюються кадр за кадром, а переміщені вузли виділяються кольором
+        highlight.
+    :param pause: Пауза між кадрами в секундах.
+    """
+    if trace is not None:
+        plt.figure(figsize=(10, 6))
+        for frame in trace:
+            nodes = build_heap_nodes(frame["heap"])
+            for i in frame["moved"]:
+                nodes[i].color = highlight
+            plt.clf()
+            _draw_heap_frame(frame["heap"], max_levels, [node.color for node in nodes])
+            plt.title(
+                f"{frame['operation']}: порівнянь {frame['comparisons']}, "
+                f"переміщень {frame['swaps']}"
+            )
+            plt.pause(pause)
+        plt.show()
+        return
+
+    plt.figure(figsize=(10, 6))
+    _draw_heap_frame(heap, max_levels, colors)
+    plt.show()
+
+
+def _draw_heap_frame(heap, max_levels=None, colors=None):
     """
-    root = build_heap_tree(heap)
+    Малює купу на поточних осях matplotlib.
+    """
+    size = len(heap)
+    if max_levels is not None:
+        size = min(size, 2**max_levels - 1)
+
     tree = nx.DiGraph()
-    pos = {root.id: (0, 0)}
-    tree = add_edges(tree, root, pos)
+    tree.add_nodes_from(range(size))
+    tree.add_edges_from(heap_edges(size).tolist())
+    pos = dict(enumerate(heap_layout(size).tolist()))
 
-    colors = [node[1]["color"] for node in tree.nodes(data=True)]
-    labels = {node[0]: node[1]["label"] for node in tree.nodes(data=True)}
+    if colors is None:
+        colors = ["skyblue"] * size
+    else:
+        colors = list(colors[:size])
+
+    # Для великих куп зменшуємо вузли і не підписуємо їх
+    node_size = 2500 if size <= 31 else max(5, 80000 // size)
+    labels = {i: heap[i] for i in range(size)} if size <= 63 else None
 
-    plt.figure(figsize=(10, 6))
     nx.draw(
-        tree, pos=pos, labels=labels, arrows=False, node_size=2500, node_color=colors
+        tree,
+        pos=pos,
+        labels=labels,
+        with_labels=labels is not None,
+        arrows=False,
+        node_size=node_size,
+        node_color=colors,
     )
-    plt.show()
 
 
+# Перевірка трасування: кожна змінена комірка має бути виділена
+rng = random.Random(0)
+for _ in range(300):
+    traced = InstrumentedHeap(
+        [rng.randint(0, 50) for _ in range(rng.randint(1, 20))], trace=True
+    )
+    for _ in range(30):
+        operation = rng.choice(("push", "pop", "replace")) if traced.data else "push"
+        if operation == "push":
+            traced.push(rng.randint(0, 50))
+        elif operation == "pop":
+            traced.pop()
+        else:
+            traced.replace(rng.randint(0, 50))
+    _check_trace(traced.trace)
+
 # Приклад використання
 heap = [10, 20, 30, 40, 50, 60, 70]
 heapq.heapify(heap)
@@ -1,7 +1,14 @@
-import matplotlib.pyplot as plt
-import networkx as nx
+import os
+import time
+import tracemalloc
+from array import array
 from collections import deque
 
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
 
 class Node:
     def __init__(self, value):
@@ -46,87 +53,539 @@ class BinaryTree:
         """
         Обхід дерева в глибину (DFS) за допомогою стека.
 
-        :return: Список значень у порядку обходу.
+        :return: Список вузлів у порядку обходу.
+        """
+        return list(self.iter_preorder())
+
+    def breadth_first_search(self):
+        """
+        Обхід дерева в ширину (BFS) за допомогою черги.
+
+        :return: Список вузлів у порядку обходу.
         """
-        visited = []
-        stack = [self.root]
+        return list(self.iter_level_order())
 
+    def iter_preorder(self, morris=False):
+        """
+        Лінивий прямий обхід (корінь, ліве, праве піддерево).
+
+        :param morris: Використати обхід Морріса з O(1) додаткової пам'яті.
+            Він тимчасово змінює посилання дерева і відновлює їх, навіть якщо
+            обхід зупинено достроково.
+        :return: Генератор вузлів у порядку обходу.
+        """
+        if morris:
+            yield from _morris(self.root, preorder=True)
+            return
+
+        stack = [self.root] if self.root else []
         while stack:
             node = stack.pop()
-            if node not in visited:
-                visited.append(node)
-                if node.right:
-                    stack.append(node.right)
-                if node.left:
-                    stack.append(node.left)
+            yield node
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
 
-        return visited
+    def iter_inorder(self, morris=False):
+        """
+        Лінивий симетричний обхід (ліве піддерево, корінь, праве піддерево).
 
-    def breadth_first_search(self):
+        :param morris: Використати обхід Морріса з O(1) додаткової пам'яті.
+            Він тимчасово змінює посилання дерева і відновлює їх, навіть якщо
+            обхід зупинено достроково.
+        :return: Генератор вузлів у порядку обходу.
         """
-        Обхід дерева в ширину (BFS) за допомогою черги.
+        if morris:
+            yield from _morris(self.root, preorder=False)
+            return
+
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def iter_postorder(self):
+        """
+        Лінивий зворотний обхід (ліве, праве піддерево, корінь).
+
+        :return: Генератор вузлів у порядку обходу.
+        """
+        stack = []
+        node = self.root
+        last_visited = None
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right and top.right is not last_visited:
+                node = top.right
+            else:
+                stack.pop()
+                yield top
+                last_visited = top
 
-        :return: Список значень у порядку обходу.
+    def iter_level_order(self):
         """
-        visited = []
-        queue = deque([self.root])
+        Лінивий обхід у ширину (за рівнями).
 
+        :return: Генератор вузлів у порядку обходу.
+        """
+        queue = deque([self.root] if self.root else [])
         while queue:
             node = queue.popleft()
-            if node not in visited:
-                visited.append(node)
-                if node.left:
-                    queue.append(node.left)
-                if node.right:
-                    queue.append(node.right)
+            yield node
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
 
-        return visited
 
+def _morris(root, preorder):
+    """
+    Обхід Морріса: замість стека використовує тимчасові посилання з
+    найправішого вузла лівого піддерева на поточний вузол.
+
+    Якщо обхід зупинено достроково, він завершується без повернення вузлів,
+    щоб прибрати всі тимчасові посилання.
 
-def visualize_tree(traversal_order, tree):
+    :param preorder: True — прямий обхід, False — симетричний.
+    :return: Генератор вузлів у порядку обходу.
     """
-    Візуалізує бінарне дерево з кольоровою зміною вузлів за порядком обходу.
+    node = root
+    try:
+        while node:
+            node, visited = _morris_step(node, preorder)
+            if visited is not None:
+                yield visited
+    finally:
+        while node:
+            node, _ = _morris_step(node, preorder)
+
+
+def _morris_step(node, preorder):
+    """
+    Один крок обходу Морріса.
+
+    :return: Кортеж (наступний вузол, відвіданий вузол або None).
+    """
+    if node.left is None:
+        return node.right, node
+
+    predecessor = node.left
+    while predecessor.right and predecessor.right is not node:
+        predecessor = predecessor.right
+
+    if predecessor.right is None:
+        # Перший візит: створюємо тимчасове посилання і йдемо ліворуч
+        predecessor.right = node
+        return node.left, node if preorder else None
+
+    # Другий візит: ліве піддерево оброблено, прибираємо посилання
+    predecessor.right = None
+    return node.right, None if preorder else node
+
+
+NIL = -1  # Індекс, що позначає відсутність нащадка
+
+
+class ArrayBinaryTree:
+    def __init__(self, root_value, typecode=None):
+        """
+        Ініціалізація компактного бінарного дерева.
+
+        Вузли ідентифікуються індексами, а значення та індекси лівих і правих
+        нащадків зберігаються в суцільних масивах.
+
+        :param root_value: Значення кореневого вузла (індекс 0).
+        :param typecode: Код типу array для числових значень; None — список
+            довільних об'єктів.
+        """
+        self.values = [] if typecode is None else array(typecode)
+        self.left = array("q")
+        self.right = array("q")
+        self.root = NIL
+        if root_value is not None:
+            self.root = self._new_node(root_value)
+
+    @classmethod
+    def from_level_order(cls, values, typecode=None):
+        """
+        Створює дерево з послідовності значень у порядку обходу в ширину.
+
+        None позначає відсутній вузол; нащадки відсутніх вузлів не вказуються
+        (як у записі [1, 2, 3, None, 5]). Вузли нумеруються в тому самому
+        порядку, тож для повного дерева нащадки вузла i мають індекси 2i+1 і 2i+2.
+        """
+        values = iter(values)
+        tree = cls(next(values, None), typecode)
+        if tree.root == NIL:
+            return tree
+
+        parent = 0  # Вузли створюються в порядку BFS, тож черга — це просто індекс
+        for left_value in values:
+            if left_value is not None:
+                tree.left[parent] = tree._new_node(left_value)
+            right_value = next(values, None)
+            if right_value is not None:
+                tree.right[parent] = tree._new_node(right_value)
+            parent += 1
+            if parent >= len(tree):
+                break
+        return tree
+
+    def __len__(self):
+        return len(self.left)
+
+    def _new_node(self, value):
+        self.values.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        return len(self.left) - 1
+
+    def add_left(self, parent, value):
+        """
+        Додає лівий нащадок до вузла з індексом parent і повертає його індекс.
+        """
+        self.left[parent] = self._new_node(value)
+        return self.left[parent]
+
+    def add_right(self, parent, value):
+        """
+        Додає правий нащадок до вузла з індексом parent і повертає його індекс.
+        """
+        self.right[parent] = self._new_node(value)
+        return self.right[parent]
+
+    def iter_preorder(self):
+        """
+        Лінивий прямий обхід.
+
+        :return: Генератор індексів вузлів у порядку обходу.
+        """
+        left, right = self.left, self.right
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if right[node] != NIL:
+                stack.append(right[node])
+            if left[node] != NIL:
+                stack.append(left[node])
+
+    def iter_inorder(self):
+        """
+        Лінивий симетричний обхід.
+
+        :return: Генератор індексів вузлів у порядку обходу.
+        """
+        left, right = self.left, self.right
+        stack = []
+        node = self.root
+        while stack or node != NIL:
+            while node != NIL:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield node
+            node = right[node]
+
+    def iter_postorder(self):
+        """
+        Лінивий зворотний обхід.
+
+        :return: Генератор індексів вузлів у порядку обходу.
+        """
+        left, right = self.left, self.right
+        stack = []
+        node = self.root
+        last_visited = NIL
+        while stack or node != NIL:
+            while node != NIL:
+                stack.append(node)
+                node = left[node]
+            top = stack[-1]
+            if right[top] != NIL and right[top] != last_visited:
+                node = right[top]
+            else:
+                stack.pop()
+                yield top
+                last_visited = top
+
+    def iter_level_order(self):
+        """
+        Лінивий обхід у ширину.
+
+        :return: Генератор індексів вузлів у порядку обходу.
+        """
+        left, right = self.left, self.right
+        queue = deque([self.root] if self.root != NIL else [])
+        while queue:
+            node = queue.popleft()
+            yield node
+            if left[node] != NIL:
+                queue.append(left[node])
+            if right[node] != NIL:
+                queue.append(right[node])
+
+
+def _complete_object_tree(values):
+    """
+    Будує повне об'єктне дерево BinaryTree зі значень у порядку обходу в ширину.
+    """
+    nodes = [Node(value) for value in values]
+    for i, node in enumerate(nodes):
+        if 2 * i + 1 < len(nodes):
+            node.left = nodes[2 * i + 1]
+        if 2 * i + 2 < len(nodes):
+            node.right = nodes[2 * i + 2]
+    tree = BinaryTree(None)
+    tree.root = nodes[0]
+    return tree
+
+
+def benchmark_trees(n=1_000_000):
+    """
+    Порівнює пам'ять і швидкість побудови та обходу для BinaryTree
+    і ArrayBinaryTree на повному дереві з n вузлів.
+    """
+    print(f"Порівняння представлень дерева для {n} вузлів:")
+    builders = {
+        "BinaryTree": _complete_object_tree,
+        "ArrayBinaryTree": lambda values: ArrayBinaryTree.from_level_order(
+            values, typecode="q"
+        ),
+    }
+    for name, build in builders.items():
+        # Пам'ять вимірюється окремим проходом: tracemalloc сповільнює
+        # кожне виділення і спотворив би час побудови
+        tracemalloc.start()
+        tree = build(range(n))
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del tree
+
+        start = time.perf_counter()
+        tree = build(range(n))
+        build_time = time.perf_counter() - start
+
+        timings = []
+        for traversal in (tree.iter_preorder, tree.iter_level_order):
+            start = time.perf_counter()
+            for _ in traversal():
+                pass
+            timings.append(time.perf_counter() - start)
+
+        print(
+            f"{name}: {memory / n:.1f} байт/вузол, побудова {build_time:.3f} с, "
+            f"прямий обхід {n / timings[0]:,.0f} вузлів/с, "
+            f"обхід у ширину {n / timings[1]:,.0f} вузлів/с"
+        )
+
+
+def tidy_layout(tree, separation=1.0):
+    """
+    Обчислює охайне розташування вузлів у стилі Рейнгольда–Тілфорда за O(n).
+
+    Піддерева обробляються у зворотному порядку обходу (без рекурсії): праве
+    піддерево зсувається від лівого на мінімальну відстань, за якої їхні
+    контури на всіх спільних рівнях розділені не менше ніж на separation, а
+    батько розміщується посередині між нащадками. Контури зберігаються
+    списками від найглибшого рівня до кореня зі спільним зсувом, тож злиття
+    коштує O(висота меншого піддерева), що в сумі дає O(n).
 
-    :param traversal_order: Порядок обходу дерева.
     :param tree: Об'єкт бінарного дерева.
+    :param separation: Мінімальна горизонтальна відстань між вузлами.
+    :return: Словник {вузол: (x, y)}, ключами якого є самі вузли.
     """
-    G = nx.Graph()
-    pos = {}  # Позиції вузлів на графі
+    if tree.root is None:
+        return {}
 
-    # Створення графа на основі дерева
-    def add_edges(node, pos_x=0, pos_y=0, layer=1):
-        if node is not None:
-            G.add_node(node.value, pos=(pos_x, pos_y))
-            pos[node.value] = (pos_x, pos_y)
-            if node.left:
-                G.add_edge(node.value, node.left.value)
-                add_edges(node.left, pos_x - 1 / layer, pos_y - 1, layer + 1)
-            if node.right:
-                G.add_edge(node.value, node.right.value)
-                add_edges(node.right, pos_x + 1 / layer, pos_y - 1, layer + 1)
+    contours = {}  # {вузол: (лівий контур, зсув, правий контур, зсув)}
+    shifts = {}  # Зсув нащадків вузла відносно нього по горизонталі
+
+    for node in tree.iter_postorder():
+        left = contours.pop(node.left) if node.left else None
+        right = contours.pop(node.right) if node.right else None
+
+        if left is None and right is None:
+            contours[node] = ([0.0], 0.0, [0.0], 0.0)
+            continue
+        if left is None or right is None:
+            # Єдиний нащадок зміщується на пів відстані у свій бік
+            shift = separation / 2
+            child = left or right
+            sign = -1 if left else 1
+            left_list, left_off, right_list, right_off = child
+            left_list.append(-sign * shift - left_off)
+            right_list.append(-sign * shift - right_off)
+            contours[node] = (
+                left_list,
+                left_off + sign * shift,
+                right_list,
+                right_off + sign * shift,
+            )
+            shifts[node] = shift
+            continue
+
+        l_left, l_left_off, l_right, l_right_off = left
+        r_left, r_left_off, r_right, r_right_off = right
+        left_height, right_height = len(l_left), len(r_left)
+
+        # Мінімальна відстань між коренями піддерев
+        gap = max(
+            l_right[left_height - 1 - d]
+            + l_right_off
+            - r_left[right_height - 1 - d]
+            - r_left_off
+            for d in range(min(left_height, right_height))
+        )
+        shift = (gap + separation) / 2
+
+        # Лівий контур: з лівого піддерева, глибші рівні — з правого
+        if left_height >= right_height:
+            new_left, new_left_off = l_left, l_left_off - shift
+        else:
+            new_left, new_left_off = r_left, r_left_off + shift
+            for d in range(left_height):
+                new_left[right_height - 1 - d] = (
+                    l_left[left_height - 1 - d] + l_left_off - shift - new_left_off
+                )
 
-    add_edges(tree.root)
+        # Правий контур: з правого піддерева, глибші рівні — з лівого
+        if right_height >= left_height:
+            new_right, new_right_off = r_right, r_right_off + shift
+        else:
+            new_right, new_right_off = l_right, l_right_off - shift
+            for d in range(right_height):
+                new_right[left_height - 1 - d] = (
+                    r_right[right_height - 1 - d] + r_right_off + shift - new_right_off
+                )
 
-    # Підготовка кольорів для вузлів
-    node_colors = []
+        new_left.append(-new_left_off)
+        new_right.append(-new_right_off)
+        contours[node] = (new_left, new_left_off, new_right, new_right_off)
+        shifts[node] = shift
+
+    # Абсолютні координати: зсуви накопичуються від кореня донизу
+    positions = {tree.root: (0.0, 0)}
+    for node in tree.iter_preorder():
+        x, y = positions[node]
+        if node.left:
+            positions[node.left] = (x - shifts[node], y - 1)
+        if node.right:
+            positions[node.right] = (x + shifts[node], y - 1)
+    return positions
+
+
+def traversal_colors(traversal_order):
+    """
+    Повертає кольори вузлів за порядком обходу: від світлого до темного.
+
+    :return: Словник {вузол: колір}.
+    """
+    colors = {}
     color_step = 1 / len(traversal_order)  # Шаг для кольору
 
     for i, node in enumerate(traversal_order):
         color_value = int(255 * (1 - i * color_step))  # Визначення відтінку
-        node_colors.append(f"#{color_value:02X}96F0")
-
-    # Візуалізація графа
-    plt.figure(figsize=(12, 8))
-    nx.draw(
-        G,
-        pos,
-        with_labels=True,
-        node_size=2000,
-        node_color=node_colors,
-        font_size=16,
-        font_weight="bold",
+        colors[node] = f"#{color_value:02X}96F0"
+    return colors
+
+
+def _draw_tree(ax, positions, colors, default_color="lightgray"):
+    """
+    Малює дерево на осях matplotlib: ребра одним LineCollection,
+    вузли одним викликом scatter.
+    """
+    nodes = list(positions)
+    segments = [
+        (positions[node], positions[child])
+        for node in nodes
+        for child in (node.left, node.right)
+        if child is not None
+    ]
+    xy = np.array([positions[node] for node in nodes], dtype=float)
+
+    # Розмір вузлів і підписи залежать від кількості вузлів
+    small = len(nodes) <= 63
+    node_size = 2000 if small else max(1, 60000 // len(nodes))
+
+    ax.add_collection(LineCollection(segments, colors="black", linewidths=0.5))
+    ax.scatter(
+        xy[:, 0],
+        xy[:, 1],
+        s=node_size,
+        c=[colors.get(node, default_color) for node in nodes],
+        zorder=2,
     )
-    plt.show()
+    if small:
+        for node, (x, y) in zip(nodes, xy):
+            ax.text(
+                x,
+                y,
+                str(node.value),
+                ha="center",
+                va="center",
+                fontsize=16,
+                fontweight="bold",
+                zorder=3,
+            )
+    ax.set_axis_off()
+    ax.autoscale_view()
+    ax.margins(0.1)
+
+
+def visualize_tree(
+    traversal_order, tree, save_path=None, frames_dir=None, num_frames=20
+):
+    """
+    Візуалізує бінарне дерево з кольоровою зміною вузлів за порядком обходу.
+
+    Вузли ідентифікуються самими об'єктами Node, тому однакові значення
+    не конфліктують, а розташування обчислює tidy_layout.
+
+    :param traversal_order: Порядок обходу дерева.
+    :param tree: Об'єкт бінарного дерева.
+    :param save_path: Якщо задано, зображення зберігається у файл без
+        відкриття вікна.
+    :param frames_dir: Якщо задано, у цю теку зберігаються кадри обходу
+        (frame_000.png, ...), на кожному з яких розфарбована більша частина
+        обходу; вікно не відкривається.
+    :param num_frames: Кількість кадрів для frames_dir.
+    """
+    positions = tidy_layout(tree)
+    colors = traversal_colors(traversal_order)
+
+    if frames_dir is not None:
+        os.makedirs(frames_dir, exist_ok=True)
+        num_frames = min(num_frames, len(traversal_order))
+        for frame in range(1, num_frames + 1):
+            visible = traversal_order[: len(traversal_order) * frame // num_frames]
+            figure = Figure(figsize=(12, 8))
+            _draw_tree(
+                figure.subplots(),
+                positions,
+                {node: colors[node] for node in visible},
+            )
+            figure.savefig(os.path.join(frames_dir, f"frame_{frame - 1:03d}.png"))
+
+    if save_path is not None:
+        figure = Figure(figsize=(12, 8))
+        _draw_tree(figure.subplots(), positions, colors)
+        figure.savefig(save_path)
+
+    if save_path is None and frames_dir is None:
+        # Візуалізація графа
+        _, ax = plt.subplots(figsize=(12, 8))
+        _draw_tree(ax, positions, colors)
+        plt.show()
 
 
 if __name__ == "__main__":
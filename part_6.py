@@ -1,3 +1,12 @@
+import argparse
+import random
+import time
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate
+
+import numpy as np
+
+
 def greedy_algorithm(items, budget):
     """
     Жадібний алгоритм для вибору страв з найбільшою калорійністю за одиницю вартості.
@@ -6,14 +15,7 @@ def greedy_algorithm(items, budget):
     :param budget: Бюджет для вибору страв.
     :return: Список обраних страв та їхня сумарна калорійність.
     """
-    # Обчислюємо співвідношення калорій до вартості для кожної страви
-    ratios = []
-    for item, info in items.items():
-        ratio = info["calories"] / info["cost"]
-        ratios.append((item, info["cost"], info["calories"], ratio))
-
-    # Сортуємо страви за співвідношенням калорій до вартості (спочатку більші)
-    ratios.sort(key=lambda x: x[3], reverse=True)
+    ratios = _ratio_order(items)
 
     total_calories = 0
     total_cost = 0
@@ -29,41 +31,451 @@ def greedy_algorithm(items, budget):
     return selected_items, total_calories
 
 
+def _ratio_order(items):
+    """
+    Повертає страви, відсортовані за співвідношенням калорій до вартості.
+
+    :return: Список кортежів (страва, ціна, калорії, співвідношення), спочатку більші.
+    """
+    # Обчислюємо співвідношення калорій до вартості для кожної страви
+    ratios = []
+    for item, info in items.items():
+        ratio = info["calories"] / info["cost"]
+        ratios.append((item, info["cost"], info["calories"], ratio))
+
+    # Сортуємо страви за співвідношенням калорій до вартості (спочатку більші)
+    ratios.sort(key=lambda x: x[3], reverse=True)
+    return ratios
+
+
+def branch_and_bound(items, budget, time_limit=None):
+    """
+    Точний метод гілок і меж для вибору страв з найбільшою калорійністю.
+
+    Не потребує таблиці за бюджетом, тому працює з великими чи дробовими
+    цінами. Страви розглядаються в порядку жадібного алгоритму, а верхня межа
+    кожної гілки — розв'язок дробової задачі (частину останньої страви можна
+    взяти), який обчислюється за O(log n) через префіксні суми.
+
+    :param items: Словник з інформацією про страви (ціна та калорії).
+    :param budget: Бюджет для вибору страв.
+    :param time_limit: Обмеження часу в секундах; після нього повертається
+        найкращий знайдений розв'язок.
+    :return: Список обраних страв, їхня сумарна калорійність та відносний
+        розрив оптимальності (0 — розв'язок доведено оптимальний).
+    """
+    ratios = _ratio_order(items)
+    n = len(ratios)
+    costs = [cost for _, cost, _, _ in ratios]
+    calories = [calories for _, _, calories, _ in ratios]
+    prefix_costs = list(accumulate(costs, initial=0))
+    prefix_calories = list(accumulate(calories, initial=0))
+
+    def upper_bound(i, capacity):
+        # Дробова релаксація для страв i..n-1 при залишку бюджету capacity
+        target = prefix_costs[i] + capacity
+        k = bisect_right(prefix_costs, target, lo=i) - 1
+        bound = prefix_calories[k] - prefix_calories[i]
+        if k < n:
+            bound += (target - prefix_costs[k]) * ratios[k][3]
+        return bound
+
+    # Початковий розв'язок — жадібний
+    best_calories = 0
+    best_chosen = None  # Обрані індекси як зв'язний список (індекс, попередні)
+    total_cost = 0
+    for i in range(n):
+        if total_cost + costs[i] <= budget:
+            total_cost += costs[i]
+            best_calories += calories[i]
+            best_chosen = (i, best_chosen)
+
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    # Вузол: (наступна страва, витрачено, калорії, обрані індекси)
+    stack = [(0, 0, 0, None)]
+    iterations = 0
+
+    while stack:
+        iterations += 1
+        if deadline is not None and iterations % 1024 == 0:
+            if time.perf_counter() > deadline:
+                break
+
+        i, cost, value, chosen = stack.pop()
+        if value > best_calories:
+            best_calories, best_chosen = value, chosen
+        if i == n or value + upper_bound(i, budget - cost) <= best_calories:
+            continue
+
+        stack.append((i + 1, cost, value, chosen))  # Без страви i
+        if cost + costs[i] <= budget:
+            # Гілка зі стравою i розглядається першою
+            stack.append((i + 1, cost + costs[i], value + calories[i], (i, chosen)))
+
+    # Верхня межа за недослідженими вузлами (якщо час вичерпано)
+    upper = max(
+        [value + upper_bound(i, budget - cost) for i, cost, value, _ in stack],
+        default=best_calories,
+    )
+    upper = max(upper, best_calories)
+    gap = (upper - best_calories) / upper if upper > 0 else 0.0
+
+    chosen_indices = set()
+    while best_chosen is not None:
+        index, best_chosen = best_chosen
+        chosen_indices.add(index)
+    chosen_names = {ratios[i][0] for i in chosen_indices}
+    # Повертаємо страви в порядку словника, як dynamic_programming
+    return [item for item in items if item in chosen_names], best_calories, gap
+
+
 def dynamic_programming(items, budget):
     """
     Алгоритм динамічного програмування для вибору страв з найбільшою калорійністю при заданому бюджеті.
 
+    Замість таблиці (n+1)×(budget+1) зберігається один рядок DP, що оновлюється
+    векторно через NumPy, а рішення "взяти страву" запам'ятовуються у бітовому
+    масиві (n·budget біт), з якого відновлюється набір обраних страв.
+
     :param items: Словник з інформацією про страви (ціна та калорії).
     :param budget: Бюджет для вибору страв.
     :return: Список обраних страв та їхня сумарна калорійність.
     """
-    # Створюємо таблицю для динамічного програмування
-    n = len(items)
-    dp = [[0] * (budget + 1) for _ in range(n + 1)]
-    selected_items = [[[] for _ in range(budget + 1)] for _ in range(n + 1)]
-
     # Перетворюємо словник на список страв
     item_list = [(item, info["cost"], info["calories"]) for item, info in items.items()]
 
-    # Динамічне програмування
-    for i in range(1, n + 1):
-        item, cost, calories = item_list[i - 1]
-        for j in range(budget + 1):
-            # Якщо поточна страва не влізає в бюджет
-            if cost > j:
-                dp[i][j] = dp[i - 1][j]
-                selected_items[i][j] = selected_items[i - 1][j]
-            else:
-                # Вибираємо між двома варіантами: взяти або не взяти поточну страву
-                if dp[i - 1][j] > dp[i - 1][j - cost] + calories:
-                    dp[i][j] = dp[i - 1][j]
-                    selected_items[i][j] = selected_items[i - 1][j]
-                else:
-                    dp[i][j] = dp[i - 1][j - cost] + calories
-                    selected_items[i][j] = selected_items[i - 1][j - cost] + [item]
+    row, decisions = _knapsack_row(
+        [cost for _, cost, _ in item_list],
+        [calories for _, _, calories in item_list],
+        budget,
+    )
+    selected = _traceback(decisions, [cost for _, cost, _ in item_list], budget)
 
     # Повертаємо обрані страви та їх сумарну калорійність
-    return selected_items[n][budget], dp[n][budget]
+    return [item_list[i][0] for i in selected], row[budget].item()
+
+
+def _knapsack_row(costs, values, budget, row=None):
+    """
+    Векторизоване динамічне програмування для задачі 0/1 про рюкзак.
+
+    row[j] — найбільша цінність при бюджеті j. Для кожного предмета рядок
+    оновлюється одним зрізом: row[cost:] = max(row[cost:], row[:-cost] + value).
+    Якщо обмежень кілька, budget і ціни — кортежі, а рядок DP стає
+    багатовимірним масивом, що оновлюється тим самим зрізом по кожній осі.
+
+    :param row: Рядок DP, який потрібно продовжити новими предметами
+        (за замовчуванням — нульовий).
+    :return: Кортеж (рядок DP, рішення), де рішення — список упакованих бітових
+        масивів: біт j - cost для предмета i означає, що при бюджеті j предмет
+        узято.
+    """
+    capacities = _as_tuple(budget)
+    dtype = np.result_type(*values) if values else np.int64
+    if row is None:
+        row = np.zeros(tuple(capacity + 1 for capacity in capacities), dtype=dtype)
+    elif not np.can_cast(dtype, row.dtype):
+        row = row.astype(np.result_type(dtype, row.dtype))
+    decisions = []
+    for cost, value in zip(costs, values):
+        cost = _as_tuple(cost)
+        if any(c > capacity for c, capacity in zip(cost, capacities)):
+            decisions.append(None)
+            continue
+        source = tuple(
+            slice(0, capacity + 1 - c) for c, capacity in zip(cost, capacities)
+        )
+        target = tuple(slice(c, None) for c in cost)
+        # Як і раніше, при рівних значеннях страва береться
+        candidate = row[source] + value
+        take = candidate >= row[target]
+        row[target] = np.where(take, candidate, row[target])
+        decisions.append(np.packbits(take))
+    return row, decisions
+
+
+def _traceback(decisions, costs, budget):
+    """
+    Відновлює індекси обраних предметів з бітових масивів рішень.
+    """
+    capacities = _as_tuple(budget)
+    selected = []
+    j = list(capacities)
+    for i in range(len(decisions) - 1, -1, -1):
+        bits = decisions[i]
+        cost = _as_tuple(costs[i])
+        if bits is None or any(jd < c for jd, c in zip(j, cost)):
+            continue
+        # Номер біта в масиві рішень розміру (capacity - cost + 1) по кожній осі
+        offset = 0
+        for jd, c, capacity in zip(j, cost, capacities):
+            offset = offset * (capacity + 1 - c) + (jd - c)
+        if bits[offset >> 3] >> (7 - (offset & 7)) & 1:
+            selected.append(i)
+            j = [jd - c for jd, c in zip(j, cost)]
+    return selected[::-1]
+
+
+def _as_tuple(value):
+    return value if isinstance(value, tuple) else (value,)
+
+
+def _split_quantities(items, keys, capacities):
+    """
+    Розбиває страви з кількістю на частини 1, 2, 4, ..., залишок (двійкове
+    розбиття), щоб звести задачу до 0/1 з O(log кількості) предметів на страву.
+
+    Кількість береться з ключа "quantity" (за замовчуванням 1); None означає
+    необмежену кількість, яка обмежується найбільшою, що вміщується в бюджет.
+
+    :return: Списки (страва, множник), цін-кортежів і цінностей частин.
+    """
+    parts, costs, values = [], [], []
+    for item, info in items.items():
+        cost = tuple(info[key] for key in keys)
+        quantity = info.get("quantity", 1)
+        if quantity is None:
+            limits = [capacity // c for c, capacity in zip(cost, capacities) if c > 0]
+            if not limits:
+                raise ValueError(f"Страва {item!r} без ціни не може бути необмеженою")
+            quantity = min(limits)
+        multiplier = 1
+        while quantity > 0:
+            take = min(multiplier, quantity)
+            parts.append((item, take))
+            costs.append(tuple(c * take for c in cost))
+            values.append(info["calories"] * take)
+            quantity -= take
+            multiplier *= 2
+    return parts, costs, values
+
+
+def _solve_quantities(items, keys, capacities):
+    """
+    Спільна частина варіантів з кількостями: двійкове розбиття, векторизоване
+    DP та відновлення кількостей.
+
+    :return: Словник {страва: кількість} та сумарна калорійність.
+    """
+    parts, costs, values = _split_quantities(items, keys, capacities)
+    row, decisions = _knapsack_row(costs, values, capacities)
+    counts = {}
+    for i in _traceback(decisions, costs, capacities):
+        item, take = parts[i]
+        counts[item] = counts.get(item, 0) + take
+    return counts, row[capacities].item()
+
+
+def bounded_knapsack(items, budget):
+    """
+    Вибір страв, кожну з яких можна взяти до info["quantity"] разів.
+
+    :param items: Словник з інформацією про страви (ціна, калорії та кількість).
+    :param budget: Бюджет для вибору страв.
+    :return: Словник {страва: кількість} та сумарна калорійність.
+    """
+    return _solve_quantities(items, ("cost",), (budget,))
+
+
+def unbounded_knapsack(items, budget):
+    """
+    Вибір страв, кожну з яких можна взяти необмежену кількість разів.
+
+    :param items: Словник з інформацією про страви (ціна та калорії).
+    :param budget: Бюджет для вибору страв.
+    :return: Словник {страва: кількість} та сумарна калорійність.
+    """
+    unbounded = {item: {**info, "quantity": None} for item, info in items.items()}
+    return _solve_quantities(unbounded, ("cost",), (budget,))
+
+
+def two_constraint_knapsack(items, budget, limit, limit_key="weight"):
+    """
+    Вибір страв з двома обмеженнями: бюджетом і лімітом за другою ознакою
+    (наприклад, вагою чи часом приготування). Враховує info["quantity"].
+
+    :param items: Словник з інформацією про страви (ціна, калорії та limit_key).
+    :param budget: Бюджет для вибору страв.
+    :param limit: Обмеження для сумарного значення limit_key.
+    :param limit_key: Назва другої ознаки в описі страви.
+    :return: Словник {страва: кількість} та сумарна калорійність.
+    """
+    return _solve_quantities(items, ("cost", limit_key), (budget, limit))
+
+
+class KnapsackSolver:
+    """
+    Розв'язувач для одного набору страв і багатьох бюджетів.
+
+    Рядок DP до max_budget обчислюється один раз, після чого найбільша
+    калорійність для будь-якого бюджету не більшого за max_budget повертається
+    за O(1), а набір страв — швидким відновленням з бітових масивів рішень.
+    Жадібний алгоритм використовує збережений порядок за співвідношенням, який
+    оновлюється вставкою чи видаленням без повного сортування.
+    """
+
+    def __init__(self, items, max_budget):
+        self.max_budget = max_budget
+        self.items = {}
+        self._order = []  # (-співвідношення, номер додавання, страва) за зростанням
+        self._keys = {}  # Ключ страви в self._order
+        self._sequence = 0  # Номер додавання зберігає порядок рівних співвідношень
+        self._names = []  # Страви в порядку рядків DP
+        self._costs = []
+        self._row = np.zeros(max_budget + 1, dtype=np.int64)
+        self._decisions = []
+        self._dirty = False  # Рядок DP треба перебудувати (після видалення)
+        for item, info in items.items():
+            self.add_item(item, info["cost"], info["calories"])
+
+    def add_item(self, item, cost, calories):
+        """
+        Додає страву: одна вставка в порядок співвідношень і один крок DP.
+        """
+        if item in self.items:
+            self.remove_item(item)
+        self.items[item] = {"cost": cost, "calories": calories}
+        key = (-calories / cost, self._sequence, item)
+        self._keys[item] = key
+        insort(self._order, key)
+        self._sequence += 1
+        if not self._dirty:
+            self._extend_row(item, cost, calories)
+
+    def remove_item(self, item):
+        """
+        Видаляє страву з порядку співвідношень; рядок DP буде перебудовано
+        під час наступного запиту.
+        """
+        del self.items[item]
+        key = self._keys.pop(item)
+        del self._order[bisect_left(self._order, key)]
+        self._dirty = True
+
+    def _extend_row(self, item, cost, calories):
+        row, decisions = _knapsack_row([cost], [calories], self.max_budget, self._row)
+        self._row = row
+        self._decisions.extend(decisions)
+        self._names.append(item)
+        self._costs.append(cost)
+
+    def _rebuild(self):
+        self._names = list(self.items)
+        self._costs = [self.items[item]["cost"] for item in self._names]
+        self._row, self._decisions = _knapsack_row(
+            self._costs,
+            [self.items[item]["calories"] for item in self._names],
+            self.max_budget,
+        )
+        self._dirty = False
+
+    def max_calories(self, budget):
+        """
+        Найбільша калорійність для бюджету budget (від 0 до max_budget) за O(1).
+        """
+        if not 0 <= budget <= self.max_budget:
+            raise ValueError(
+                f"Бюджет {budget} має бути в межах від 0 до max_budget {self.max_budget}"
+            )
+        if self._dirty:
+            self._rebuild()
+        return self._row[budget].item()
+
+    def dynamic_programming(self, budget):
+        """
+        Оптимальний вибір страв для бюджету, як у функції dynamic_programming.
+
+        :return: Список обраних страв та їхня сумарна калорійність.
+        """
+        total = self.max_calories(budget)  # Перевіряє межі бюджету
+        selected = _traceback(self._decisions, self._costs, budget)
+        return [self._names[i] for i in selected], total
+
+    def greedy(self, budget):
+        """
+        Жадібний вибір страв за збереженим порядком співвідношень.
+
+        :return: Список обраних страв та їхня сумарна калорійність.
+        """
+        total_calories = 0
+        total_cost = 0
+        selected_items = []
+        for _, _, item in self._order:
+            info = self.items[item]
+            if total_cost + info["cost"] <= budget:
+                selected_items.append(item)
+                total_calories += info["calories"]
+                total_cost += info["cost"]
+        return selected_items, total_calories
+
+
+def benchmark_solvers(sizes=(20, 50, 100, 200, 500), max_cost=1000, seed=0):
+    """
+    Порівнює жадібний алгоритм, динамічне програмування та метод гілок і меж
+    на випадкових наборах страв: час і знайдену калорійність.
+    """
+    rng = random.Random(seed)
+    print("Порівняння алгоритмів на випадкових наборах страв:")
+    for size in sizes:
+        items = {
+            f"item{i}": {
+                "cost": rng.randint(1, max_cost),
+                "calories": rng.randint(1, max_cost),
+            }
+            for i in range(size)
+        }
+        budget = size * max_cost // 4
+        results = []
+        for name, solver in (
+            ("greedy", greedy_algorithm),
+            ("dp", dynamic_programming),
+            ("b&b", branch_and_bound),
+        ):
+            start = time.perf_counter()
+            total = solver(items, budget)[1]
+            results.append(f"{name} {total} за {time.perf_counter() - start:.3f} с")
+        print(f"{size} страв, бюджет {budget}: " + ", ".join(results))
+
+
+def benchmark_variants(sizes=(10, 50, 100, 200, 400), max_cost=100, seed=0):
+    """
+    Показує, як час варіантів з кількостями та двома обмеженнями зростає
+    з розміром набору страв.
+    """
+    rng = random.Random(seed)
+    print("Масштабування варіантів задачі про рюкзак:")
+    for size in sizes:
+        items = {
+            f"item{i}": {
+                "cost": rng.randint(1, max_cost),
+                "calories": rng.randint(1, max_cost),
+                "weight": rng.randint(1, max_cost),
+                "quantity": rng.randint(1, 10),
+            }
+            for i in range(size)
+        }
+        budget = size * max_cost // 4
+        results = []
+        for name, solve in (
+            ("обмежена кількість", lambda: bounded_knapsack(items, budget)),
+            ("необмежена кількість", lambda: unbounded_knapsack(items, budget)),
+            ("два обмеження", lambda: two_constraint_knapsack(items, 500, 500)),
+        ):
+            start = time.perf_counter()
+            solve()
+            results.append(f"{name} {time.perf_counter() - start:.3f} с")
+        print(f"{size} страв: " + ", ".join(results))
+
+
+def parse_args():
+    """
+    Розбирає аргументи командного рядка.
+    """
+    parser = argparse.ArgumentParser(description="Вибір страв за бюджетом.")
+    parser.add_argument(
+        "--benchmark", action="store_true", help="Виміряти час розв'язувачів."
+    )
+    return parser.parse_args()
 
 
 # Тестування:
@@ -89,3 +501,17 @@ selected_items_dp, total_calories_dp = dynamic_programming(items, budget)
 print("\nDynamic Programming:")
 print("Selected items:", selected_items_dp)
 print("Total calories:", total_calories_dp)
+
+# Метод гілок і меж
+selected_items_bb, total_calories_bb, gap_bb = branch_and_bound(items, budget)
+print("\nBranch and Bound:")
+print("Selected items:", selected_items_bb)
+print("Total calories:", total_calories_bb)
+print("Optimality gap:", gap_bb)
+
+
+if __name__ == "__main__":
+    # Бенчмарки тривають довго, тож запускаються лише за прапорцем --benchmark
+    if parse_args().benchmark:
+        benchmark_solvers()
+        benchmark_variants()
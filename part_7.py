@@ -1,28 +1,243 @@
-import random
+import argparse
+import os
+import time
+from collections import Counter
+from itertools import groupby
+from statistics import NormalDist
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 from tabulate import tabulate
 import matplotlib.pyplot as plt
 
+CHUNK_SIZE = 1_000_000  # Кількість кидків, що генеруються за один крок
+DEFAULT_DICE = (6, 6)  # Два шестигранні кубики
+FFT_THRESHOLD = 64  # Довжина многочлена, з якої згортка виконується через FFT
+
+
+def parse_dice(spec):
+    """
+    Розбирає опис набору кубиків у нотації "KdM", наприклад "2d6" або "20d10+1d8".
+
+    Args:
+        spec (str): Опис набору кубиків.
 
-def simulate_dice_rolls(num_rolls):
+    Returns:
+        tuple: Кількість граней для кожного кубика в наборі.
+    """
+    dice = []
+    for part in spec.lower().replace(" ", "").split("+"):
+        count, _, faces = part.partition("d")
+        if not faces.isdigit() or int(faces) < 1 or (count and not count.isdigit()):
+            raise ValueError(f"Некоректний опис кубиків: {spec!r}")
+        dice.extend([int(faces)] * int(count or 1))
+    if not dice:
+        raise ValueError(f"Некоректний опис кубиків: {spec!r}")
+    return tuple(dice)
+
+
+def describe_dice(dice):
     """
-    Симулює кидання двох кубиків задану кількість разів і повертає частоти сум.
+    Повертає опис набору кубиків у нотації "KdM", зворотний до parse_dice.
+
+    Args:
+        dice (tuple): Кількість граней для кожного кубика в наборі.
+
+    Returns:
+        str: Опис набору, наприклад "2d6" або "20d10+1d8".
+    """
+    return "+".join(f"{len(list(group))}d{faces}" for faces, group in groupby(dice))
+
+
+def _count_sums(num_rolls, rng, chunk_size, dice=DEFAULT_DICE):
+    """
+    Генерує кидки блоками і повертає гістограму сум у вигляді масиву NumPy.
+
+    Args:
+        num_rolls (int): Кількість кидків.
+        rng (np.random.Generator): Генератор випадкових чисел.
+        chunk_size (int): Максимальна кількість кидків в одному блоці.
+        dice (tuple): Кількість граней для кожного кубика в наборі.
+
+    Returns:
+        np.ndarray: Масив частот, де індекс відповідає сумі.
+    """
+    max_sum = sum(dice)
+    counts = np.zeros(max_sum + 1, dtype=np.int64)  # Індекс масиву відповідає сумі
+    groups = Counter(dice)  # Однакові кубики кидаємо одним викликом генератора
+
+    remaining = num_rolls
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        totals = np.zeros(size, dtype=np.int64)
+        for faces, count in groups.items():
+            rolls = rng.integers(1, faces + 1, size=(size, count), dtype=np.int32)
+            totals += rolls.sum(axis=1)  # Суми кубиків блоку
+        counts += np.bincount(totals, minlength=max_sum + 1)
+        remaining -= size
+
+    return counts
+
+
+def simulate_dice_rolls(
+    num_rolls, rng=None, chunk_size=CHUNK_SIZE, workers=1, dice=DEFAULT_DICE
+):
+    """
+    Симулює кидання набору кубиків задану кількість разів і повертає частоти сум.
+
+    Кидки генеруються блоками фіксованого розміру за допомогою NumPy, а суми
+    підраховуються через np.bincount, тому пам'ять обмежена розміром блоку
+    незалежно від загальної кількості кидків.
+
+    Якщо workers > 1, кидки розподіляються між процесами. Кожен процес отримує
+    незалежний потік випадкових чисел (Generator.spawn, тобто SeedSequence.spawn),
+    тому для однакового зерна та кількості процесів результат детермінований.
 
     Args:
         num_rolls (int): Кількість симуляцій (кидків кубиків).
+        rng (int | np.random.Generator | None): Зерно або генератор для
+            відтворюваних результатів.
+        chunk_size (int): Максимальна кількість кидків в одному блоці.
+        workers (int): Кількість процесів для паралельної симуляції.
+        dice (tuple): Кількість граней для кожного кубика в наборі
+            (за замовчуванням два шестигранні кубики).
+
+    Returns:
+        dict: Словник з частотами кожної можливої суми (від len(dice) до sum(dice)).
+    """
+    rng = np.random.default_rng(rng)
+
+    if workers <= 1:
+        counts = _count_sums(num_rolls, rng, chunk_size, dice)
+    else:
+        # Рівномірно ділимо кидки між процесами
+        base, extra = divmod(num_rolls, workers)
+        shares = [base + (1 if i < extra else 0) for i in range(workers)]
+        streams = rng.spawn(workers)  # Незалежні потоки для кожного процесу
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partial_counts = executor.map(
+                _count_sums,
+                shares,
+                streams,
+                [chunk_size] * workers,
+                [dice] * workers,
+            )
+            counts = sum(partial_counts)
+
+    return {i: int(counts[i]) for i in range(len(dice), sum(dice) + 1)}
+
+
+def simulate_until_converged(
+    tolerance,
+    batch_size=CHUNK_SIZE,
+    max_rolls=None,
+    rng=None,
+    dice=DEFAULT_DICE,
+    confidence=0.95,
+    analytical_probs=None,
+):
+    """
+    Симулює кидки партіями, доки оцінки ймовірностей не досягнуть заданої точності.
+
+    Після кожної партії генератор повертає знімок стану симуляції. Якщо передано
+    analytical_probs, зупинка відбувається, коли максимальне відхилення від них
+    менше tolerance; інакше — коли найбільша півширина довірчого інтервалу
+    (нормальне наближення) для ймовірності суми менша за tolerance.
+
+    Args:
+        tolerance (float): Цільова точність у відсоткових пунктах.
+        batch_size (int): Кількість кидків в одній партії.
+        max_rolls (int | None): Максимальна кількість кидків (None — без обмеження).
+        rng (int | np.random.Generator | None): Зерно або генератор для
+            відтворюваних результатів.
+        dice (tuple): Кількість граней для кожного кубика в наборі.
+        confidence (float): Рівень довіри для довірчих інтервалів.
+        analytical_probs (dict | None): Аналітичні ймовірності (у відсотках) для
+            критерію зупинки за відхиленням.
+
+    Yields:
+        dict: Знімок стану з ключами "rolls", "frequencies", "probabilities",
+            "half_widths", "max_half_width", "max_deviation" та "converged".
+    """
+    rng = np.random.default_rng(rng)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)  # Квантиль нормального розподілу
+    sums = range(len(dice), sum(dice) + 1)
+    counts = np.zeros(sum(dice) + 1, dtype=np.int64)
+    if analytical_probs is not None:
+        expected = np.array([analytical_probs[s] for s in sums])
+
+    rolls = 0
+    while max_rolls is None or rolls < max_rolls:
+        size = batch_size if max_rolls is None else min(batch_size, max_rolls - rolls)
+        counts += _count_sums(size, rng, batch_size, dice)
+        rolls += size
+
+        # Поточні оцінки ймовірностей та півширини довірчих інтервалів (у відсотках)
+        estimates = counts[len(dice) :] / rolls
+        half_widths = z * np.sqrt(estimates * (1 - estimates) / rolls) * 100
+        max_half_width = float(half_widths.max())
+
+        if analytical_probs is None:
+            max_deviation = None
+            converged = max_half_width < tolerance
+        else:
+            max_deviation = float(np.abs(estimates * 100 - expected).max())
+            converged = max_deviation < tolerance
+
+        yield {
+            "rolls": rolls,
+            "frequencies": {s: int(counts[s]) for s in sums},
+            "probabilities": dict(zip(sums, (estimates * 100).tolist())),
+            "half_widths": dict(zip(sums, half_widths.tolist())),
+            "max_half_width": max_half_width,
+            "max_deviation": max_deviation,
+            "converged": converged,
+        }
+
+        if converged:
+            return
+
+
+def benchmark_scaling(num_rolls, max_workers, seed=0, dice=DEFAULT_DICE):
+    """
+    Вимірює швидкість симуляції (кидків за секунду) для різної кількості процесів.
+
+    Args:
+        num_rolls (int): Кількість кидків для кожного вимірювання.
+        max_workers (int): Максимальна кількість процесів.
+        seed (int): Зерно генератора.
+        dice (tuple): Кількість граней для кожного кубика в наборі.
 
     Returns:
-        dict: Словник з частотами кожної можливої суми (від 2 до 12).
+        str: Форматована таблиця з результатами.
     """
-    sums = {i: 0 for i in range(2, 13)}  # Ініціалізація частот для сум від 2 до 12
+    worker_counts = []
+    workers = 1
+    while workers < max_workers:
+        worker_counts.append(workers)
+        workers *= 2
+    worker_counts.append(max_workers)
 
-    for _ in range(num_rolls):
-        die1 = random.randint(1, 6)  # Кидок першого кубика
-        die2 = random.randint(1, 6)  # Кидок другого кубика
-        total = die1 + die2  # Обчислення суми
-        sums[total] += 1  # Збільшення лічильника для цієї суми
+    table_data = []
+    base_time = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        simulate_dice_rolls(num_rolls, rng=seed, workers=workers, dice=dice)
+        elapsed = time.perf_counter() - start
+        if base_time is None:
+            base_time = elapsed
+        table_data.append(
+            [
+                workers,
+                f"{elapsed:.3f}",
+                f"{num_rolls / elapsed:,.0f}",
+                f"{base_time / elapsed:.2f}x",
+            ]
+        )
 
-    return sums
+    headers = ["Процеси", "Час (с)", "Кидків/с", "Прискорення"]
+    return tabulate(table_data, headers=headers, tablefmt="grid")
 
 
 def calculate_probabilities(frequencies, total_rolls):
@@ -42,25 +257,71 @@ def calculate_probabilities(frequencies, total_rolls):
     return probabilities
 
 
-def analytical_probabilities():
+def _convolve(a, b):
     """
-    Повертає аналітичні ймовірності сум при киданні двох кубиків (з таблиці).
+    Перемножує два многочлени (згортка коефіцієнтів).
+
+    Для довгих многочленів використовується FFT, для коротких — пряма згортка.
+
+    Args:
+        a (np.ndarray): Коефіцієнти першого многочлена.
+        b (np.ndarray): Коефіцієнти другого многочлена.
+
+    Returns:
+        np.ndarray: Коефіцієнти добутку.
+    """
+    if min(len(a), len(b)) < FFT_THRESHOLD:
+        return np.convolve(a, b)
+    n = len(a) + len(b) - 1
+    result = np.fft.irfft(np.fft.rfft(a, n) * np.fft.rfft(b, n), n)
+    return np.clip(result, 0.0, None)  # Прибираємо від'ємний шум округлення
+
+
+def _power(poly, exponent):
+    """
+    Підносить многочлен до степеня методом двійкового піднесення.
+
+    Args:
+        poly (np.ndarray): Коефіцієнти многочлена.
+        exponent (int): Степінь (не менше 1).
+
+    Returns:
+        np.ndarray: Коефіцієнти многочлена poly ** exponent.
+    """
+    result = None
+    while exponent:
+        if exponent & 1:
+            result = poly if result is None else _convolve(result, poly)
+        exponent >>= 1
+        if exponent:
+            poly = _convolve(poly, poly)
+    return result
+
+
+def analytical_probabilities(dice=DEFAULT_DICE):
+    """
+    Обчислює точні ймовірності сум при киданні набору кубиків.
+
+    Розподіл одного кубика з m гранями — це многочлен (x + x^2 + ... + x^m) / m,
+    а розподіл суми — добуток таких многочленів для всіх кубиків набору.
+
+    Args:
+        dice (tuple): Кількість граней для кожного кубика в наборі
+            (за замовчуванням два шестигранні кубики).
 
     Returns:
         dict: Словник з аналітичними ймовірностями для кожної суми (у відсотках).
     """
+    distribution = np.ones(1)
+    for faces, count in sorted(Counter(dice).items()):
+        die = np.full(faces, 1.0 / faces)  # Коефіцієнти при x^1..x^m
+        distribution = _convolve(distribution, _power(die, count))
+
+    # Коефіцієнт з індексом 0 відповідає мінімальній сумі len(dice)
+    min_sum = len(dice)
     return {
-        2: 2.78,
-        3: 5.56,
-        4: 8.33,
-        5: 11.11,
-        6: 13.89,
-        7: 16.67,
-        8: 13.89,
-        9: 11.11,
-        10: 8.33,
-        11: 5.56,
-        12: 2.78,
+        min_sum + i: float(probability) * 100
+        for i, probability in enumerate(distribution)
     }
 
 
@@ -77,7 +338,7 @@ def create_probability_table(monte_carlo_probs, analytical_probs):
         str: Форматована таблиця у вигляді рядка.
     """
     table_data = []
-    for sum_value in range(2, 13):
+    for sum_value in sorted(analytical_probs):
         table_data.append(
             [
                 sum_value,
@@ -100,14 +361,14 @@ def plot_probabilities(monte_carlo_probs, analytical_probs):
         monte_carlo_probs (dict): Ймовірності, отримані методом Монте-Карло.
         analytical_probs (dict): Аналітичні ймовірності.
     """
-    sums = list(range(2, 13))
+    sums = sorted(analytical_probs)
     monte_carlo = [monte_carlo_probs[s] for s in sums]
     analytical = [analytical_probs[s] for s in sums]
 
     plt.figure(figsize=(10, 6))
     plt.plot(sums, monte_carlo, label="Монте-Карло", marker="o")
     plt.plot(sums, analytical, label="Аналітичні", marker="o", linestyle="--")
-    plt.title("Порівняння ймовірностей сум при киданні двох кубиків")
+    plt.title("Порівняння ймовірностей сум при киданні кубиків")
     plt.xlabel("Сума")
     plt.ylabel("Ймовірність (%)")
     plt.legend()
@@ -116,19 +377,23 @@ def plot_probabilities(monte_carlo_probs, analytical_probs):
     plt.close()
 
 
-def generate_readme(monte_carlo_probs, analytical_probs):
+def generate_readme(monte_carlo_probs, analytical_probs, dice=DEFAULT_DICE):
     """
     Генерує файл Readme.md з висновками про порівняння ймовірностей.
 
     Args:
         monte_carlo_probs (dict): Ймовірності, отримані методом Монте-Карло.
         analytical_probs (dict): Аналітичні ймовірності.
+        dice (tuple): Кількість граней для кожного кубика в наборі.
     """
+    count = len(dice)
+    noun = "кубика" if count % 10 == 1 and count % 100 != 11 else "кубиків"
+    dice_description = f"{count} {noun} ({describe_dice(dice)})"
     with open("Readme.md", "w", encoding="utf-8") as f:
         f.write("# Висновки про симуляцію кидків кубиків\n\n")
         f.write("## Опис задачі\n")
         f.write(
-            "Була проведена симуляція кидання двох кубиків за допомогою методу Монте-Карло та порівняння результатів з аналітичними ймовірностями, наведеними в таблиці.\n\n"
+            f"Була проведена симуляція кидання {dice_description} за допомогою методу Монте-Карло та порівняння результатів з аналітичними ймовірностями, наведеними в таблиці.\n\n"
         )
 
         f.write("## Результати\n")
@@ -150,23 +415,107 @@ def generate_readme(monte_carlo_probs, analytical_probs):
 
         f.write("## Висновки\n")
         f.write(
-            "Симуляція методом Монте-Карло достовірно відтворює розподіл ймовірностей сум при киданні двох кубиків, хоча невеликі відхилення можливі через випадковість процесу. Збільшення кількості симуляцій (наприклад, до мільйона або більше) може покращити точність результатів."
+            f"Симуляція методом Монте-Карло достовірно відтворює розподіл ймовірностей сум при киданні {dice_description}, хоча невеликі відхилення можливі через випадковість процесу. Збільшення кількості симуляцій (наприклад, до мільйона або більше) може покращити точність результатів."
         )
 
 
+def parse_args():
+    """
+    Розбирає аргументи командного рядка.
+
+    Returns:
+        argparse.Namespace: Параметри запуску симуляції.
+    """
+    parser = argparse.ArgumentParser(
+        description="Симуляція кидків кубиків методом Монте-Карло."
+    )
+    parser.add_argument(
+        "--dice",
+        type=parse_dice,
+        default=DEFAULT_DICE,
+        help='Набір кубиків у нотації KdM, наприклад "2d6" або "20d10+1d8".',
+    )
+    parser.add_argument(
+        "--rolls", type=int, default=1000000, help="Кількість кидків кубиків."
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Кількість процесів для симуляції."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Зерно генератора випадкових чисел."
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Виміряти масштабування від 1 до --workers (або всіх ядер) процесів.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=None,
+        help="Симулювати партіями до досягнення точності (у відсоткових пунктах); "
+        "--rolls тоді задає максимальну кількість кидків.",
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=CHUNK_SIZE,
+        help="Розмір партії кидків для режиму --tolerance.",
+    )
+    args = parser.parse_args()
+    if args.rolls < 1:
+        parser.error("--rolls має бути не менше 1")
+    if args.batch < 1:
+        parser.error("--batch має бути не менше 1")
+    if args.tolerance is not None and args.workers > 1 and not args.benchmark:
+        # Партії режиму --tolerance симулюються послідовно в одному процесі
+        parser.error("--workers не підтримується разом із --tolerance")
+    return args
+
+
 def main():
     """
     Головна функція для виконання симуляції, аналізу та візуалізації результатів.
     """
-    num_rolls = 1000000  # Кількість симуляцій (можна змінити для точності)
+    args = parse_args()
+    num_rolls = args.rolls  # Кількість симуляцій (можна змінити для точності)
+
+    if args.benchmark:
+        max_workers = args.workers if args.workers > 1 else os.cpu_count()
+        print("Масштабування симуляції за кількістю процесів:")
+        print(
+            benchmark_scaling(
+                num_rolls, max_workers, seed=args.seed or 0, dice=args.dice
+            )
+        )
+        return
+
+    # Аналітичні ймовірності
+    analytical_probs = analytical_probabilities(args.dice)
 
     # Симуляція кидків кубиків
-    frequencies = simulate_dice_rolls(num_rolls)
+    if args.tolerance is not None:
+        for snapshot in simulate_until_converged(
+            args.tolerance,
+            batch_size=args.batch,
+            max_rolls=num_rolls,
+            rng=args.seed,
+            dice=args.dice,
+        ):
+            print(
+                f"Кидків: {snapshot['rolls']:,}, "
+                f"макс. півширина інтервалу: {snapshot['max_half_width']:.4f}%"
+            )
+        frequencies = snapshot["frequencies"]
+        num_rolls = snapshot["rolls"]
+        if not snapshot["converged"]:
+            print("Цільової точності не досягнуто за задану кількість кидків.")
+    else:
+        frequencies = simulate_dice_rolls(
+            num_rolls, rng=args.seed, workers=args.workers, dice=args.dice
+        )
     monte_carlo_probs = calculate_probabilities(frequencies, num_rolls)
 
-    # Аналітичні ймовірності
-    analytical_probs = analytical_probabilities()
-
     # Створення таблиці
     print("Порівняння ймовірностей (Монте-Карло vs Аналітичні):")
     print(create_probability_table(monte_carlo_probs, analytical_probs))
@@ -175,7 +524,7 @@ def main():
     plot_probabilities(monte_carlo_probs, analytical_probs)
 
     # Генерація Readme.md
-    generate_readme(monte_carlo_probs, analytical_probs)
+    generate_readme(monte_carlo_probs, analytical_probs, dice=args.dice)
     print("\nФайл Readme.md та графік dice_probabilities.png створено.")
 
 